@@ -18,6 +18,7 @@ from compose_farm.console import (
     print_success,
     print_warning,
 )
+from compose_farm.executor import close_ssh_connections
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine, Generator
@@ -104,6 +105,14 @@ def progress_bar(
         yield progress, task_id
 
 
+async def _closing_ssh_connections(coro: Coroutine[None, None, _T]) -> _T:
+    """Await a coroutine, then close the SSH connections it pooled."""
+    try:
+        return await coro
+    finally:
+        await close_ssh_connections()
+
+
 def run_parallel_with_progress(
     label: str,
     items: list[_T],
@@ -132,7 +141,7 @@ def run_parallel_with_progress(
                 progress.update(task_id, advance=1, description=f"[cyan]{result[0]}[/]")
             return results
 
-    return asyncio.run(gather())
+    return asyncio.run(_closing_ssh_connections(gather()))
 
 
 def load_config_or_exit(config_path: Path | None) -> Config:
@@ -209,7 +218,7 @@ def get_stacks(
 def run_async(coro: Coroutine[None, None, _T]) -> _T:
     """Run async coroutine."""
     try:
-        return asyncio.run(coro)
+        return asyncio.run(_closing_ssh_connections(coro))
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted[/]")
         raise typer.Exit(130) from None  # Standard exit code for SIGINT
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING, Annotated
 
 import typer
@@ -75,6 +76,10 @@ def web(
     console.print(f"[green]Starting Compose Farm Web UI[/] at http://{host}:{port}")
     console.print("[dim]Press Ctrl+C to stop[/]")
 
+    if reload:
+        # Let the app re-read edited templates (inherited by the reload worker)
+        os.environ["CF_WEB_RELOAD"] = "1"
+
     uvicorn.run(
         "compose_farm.web:create_app",
         factory=True,
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import socket
 import subprocess
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
@@ -14,13 +16,17 @@ from .console import console, err_console, format_stack_prefix
 from .ssh_keys import get_key_path, get_ssh_auth_sock, get_ssh_env
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable
+
+    import asyncssh
 
     from .config import Config, Host
 
 LOCAL_ADDRESSES = frozenset({"local", "localhost", "127.0.0.1", "::1"})
 _DEFAULT_SSH_PORT = 22
 _REMOTE_CHECK_ATTEMPTS = 2
+# Max command output read at once; a burst of lines is printed in one call
+_STREAM_READ_SIZE = 65536
 
 
 class TTLCache:
@@ -54,6 +60,9 @@ class TTLCache:
 # Cache compose labels per host for 30 seconds
 _compose_labels_cache = TTLCache(ttl_seconds=30.0)
 
+# Label fetches still running, by host; concurrent callers share the result
+_compose_labels_inflight: dict[str, asyncio.Task[dict[str, tuple[str, str]]]] = {}
+
 
 def _print_compose_command(
     host_name: str,
@@ -75,19 +84,27 @@ async def _stream_output_lines(
     """Stream lines from a reader to console with a stack prefix.
 
     Works with both asyncio.StreamReader (bytes) and asyncssh readers (str).
-    If prefix is empty, output is printed without a prefix.
+    If prefix is empty, output is printed without a prefix. Whatever output
+    is available is read at once and its complete lines printed together;
+    a partial line waits for the rest of it.
     """
     out = err_console if is_stderr else console
     # Lazy import: Rich markup escaping is only needed when streaming command output.
     from rich.markup import escape  # noqa: PLC0415
 
-    async for line in reader:
-        text = line.decode() if isinstance(line, bytes) else line
-        if text.strip():
-            if prefix:
-                out.print(f"{format_stack_prefix(prefix)} {escape(text)}", end="")
-            else:
-                out.print(escape(text), end="")
+    # The prefix is the same for every line, so format it once
+    line_prefix = f"{format_stack_prefix(prefix)} " if prefix else ""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    while chunk := await reader.read(_STREAM_READ_SIZE):
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        *lines, pending = (pending + text).split("\n")
+        batch = "".join(f"{line_prefix}{escape(line)}\n" for line in lines if line.strip())
+        if batch:
+            out.print(batch, end="")
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        out.print(line_prefix + escape(pending), end="")
 
 
 def build_ssh_command(host: Host, command: str, *, tty: bool = False) -> list[str]:
@@ -220,6 +237,110 @@ def ssh_connect_kwargs(host: Host) -> dict[str, Any]:
     return kwargs
 
 
+# OpenSSH allows 10 sessions per connection by default (MaxSessions); stay below it
+_SSH_MAX_SHARED_CHANNELS = 8
+# sshd starts dropping unauthenticated connections past 10 (MaxStartups); stay below it
+_SSH_MAX_HANDSHAKES = 8
+_SSH_KEEPALIVE_SECONDS = 30
+
+
+@dataclass
+class _PooledConnection:
+    """A shared SSH connection, its free channel slots, and the host's handshake slots."""
+
+    conn: asyncssh.SSHClientConnection
+    channels: asyncio.Semaphore
+    handshakes: asyncio.Semaphore
+
+
+# One SSH connection per host, reused across commands to skip the handshake.
+# Pools are per event loop because the CLI runs each batch in its own asyncio.run.
+_ssh_pools: dict[
+    asyncio.AbstractEventLoop, dict[tuple[str, int, str], asyncio.Task[_PooledConnection]]
+] = {}
+
+
+async def _connect_pooled(host: Host) -> _PooledConnection:
+    """Open a keepalive SSH connection for the pool."""
+    import asyncssh  # noqa: PLC0415 - lazy import for faster CLI startup
+
+    conn = await asyncssh.connect(
+        **ssh_connect_kwargs(host), keepalive_interval=_SSH_KEEPALIVE_SECONDS
+    )
+    return _PooledConnection(
+        conn,
+        asyncio.Semaphore(_SSH_MAX_SHARED_CHANNELS),
+        asyncio.Semaphore(_SSH_MAX_HANDSHAKES),
+    )
+
+
+def _is_reusable(task: asyncio.Task[_PooledConnection]) -> bool:
+    """Check whether a pooled connection attempt is pending or still open."""
+    if not task.done():
+        return True
+    if task.cancelled() or task.exception() is not None:
+        return False
+    return not task.result().conn.is_closed()
+
+
+async def _get_pooled_connection(host: Host) -> _PooledConnection:
+    """Get the shared connection to a host, connecting on first use."""
+    loop = asyncio.get_running_loop()
+    pool = _ssh_pools.get(loop)
+    if pool is None:
+        # Forget pools left behind by finished event loops
+        for old_loop in [lp for lp in _ssh_pools if lp.is_closed()]:
+            del _ssh_pools[old_loop]
+        pool = _ssh_pools[loop] = {}
+
+    key = (host.address, host.port, host.user)
+    task = pool.get(key)
+    if task is None or not _is_reusable(task):
+        # Concurrent callers share this task instead of racing their own connects
+        task = pool[key] = asyncio.create_task(_connect_pooled(host))
+    try:
+        return await asyncio.shield(task)
+    except BaseException:
+        if task.done() and pool.get(key) is task:
+            del pool[key]
+        raise
+
+
+@asynccontextmanager
+async def ssh_connection(host: Host) -> AsyncIterator[asyncssh.SSHClientConnection]:
+    """Yield an SSH connection to a host, sharing one per host where possible.
+
+    When all shared channels are busy, a dedicated connection is opened so
+    parallel commands are never queued behind each other. Only the handshakes
+    of those are limited, so a large fan-out is not dropped by sshd.
+    """
+    import asyncssh  # noqa: PLC0415 - lazy import for faster CLI startup
+
+    pooled = await _get_pooled_connection(host)
+    if pooled.channels.locked():
+        async with pooled.handshakes:
+            conn = await asyncssh.connect(**ssh_connect_kwargs(host))
+        async with conn:
+            yield conn
+        return
+    async with pooled.channels:
+        yield pooled.conn
+
+
+async def close_ssh_connections() -> None:
+    """Close the pooled SSH connections opened on the running event loop."""
+    pool = _ssh_pools.pop(asyncio.get_running_loop(), {})
+    conns = []
+    for task in pool.values():
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            conns.append(task.result().conn)
+    for conn in conns:
+        conn.close()
+    await asyncio.gather(*(conn.wait_closed() for conn in conns))
+
+
 async def _run_local_command(
     command: str,
     stack: str,
@@ -323,7 +444,7 @@ async def _run_ssh_command(
 
     proc: asyncssh.SSHClientProcess[Any]
     try:
-        async with asyncssh.connect(**ssh_connect_kwargs(host)) as conn:  # noqa: SIM117
+        async with ssh_connection(host) as conn:  # noqa: SIM117
             async with conn.create_process(command) as proc:
                 if stream:
                     await asyncio.gather(
@@ -626,14 +747,15 @@ async def run_sequential_on_stacks(
     single_host_tasks = []
 
     for stack in stacks:
-        if config.is_multi_host(stack) and filter_host is None:
+        multi_host = config.is_multi_host(stack)
+        if multi_host and filter_host is None:
             # Multi-host stack without filter: run on all hosts
             multi_host_tasks.append(
                 _run_sequential_stack_commands_multi_host(
                     config, stack, commands, stream=stream, raw=raw, prefix=prefix
                 )
             )
-        elif config.is_multi_host(stack) and filter_host is not None:
+        elif multi_host and filter_host is not None:
             # Multi-host stack with filter: run only on filtered host
             single_host_tasks.append(
                 _run_sequential_stack_commands_on_host(
@@ -647,18 +769,15 @@ async def run_sequential_on_stacks(
                 )
             )
 
-    # Gather results separately to maintain type safety
-    flat_results: list[CommandResult] = []
-
-    if multi_host_tasks:
-        multi_results = await asyncio.gather(*multi_host_tasks)
-        for result_list in multi_results:
-            flat_results.extend(result_list)
-
-    if single_host_tasks:
-        single_results = await asyncio.gather(*single_host_tasks)
-        flat_results.extend(single_results)
+    # Gather each group separately for type safety, but run both groups at once
+    multi_results, single_results = await asyncio.gather(
+        asyncio.gather(*multi_host_tasks), asyncio.gather(*single_host_tasks)
+    )
 
+    flat_results: list[CommandResult] = []
+    for result_list in multi_results:
+        flat_results.extend(result_list)
+    flat_results.extend(single_results)
     return flat_results
 
 
@@ -718,6 +837,18 @@ async def get_container_compose_labels(
     if cached is not None:
         return cached
 
+    task = _compose_labels_inflight.get(host_name)
+    # A task left behind by another event loop (e.g. a previous CLI run) can't be awaited here
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_fetch_compose_labels(config, host_name))
+        _compose_labels_inflight[host_name] = task
+        task.add_done_callback(lambda _: _compose_labels_inflight.pop(host_name, None))
+    # Shield so one cancelled request doesn't abort the lookup for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_compose_labels(config: Config, host_name: str) -> dict[str, tuple[str, str]]:
+    """Run docker ps on a host and cache its container compose labels."""
     host = config.hosts[host_name]
     cmd = (
         "docker ps -a --format "
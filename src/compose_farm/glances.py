@@ -16,11 +16,25 @@ if TYPE_CHECKING:
 DEFAULT_GLANCES_PORT = 61208
 
 
+# Binary unit suffixes for format_bytes (1 KiB = 1024 bytes)
+_BINARY_SUFFIXES = ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB")
+_BYTES_PER_KIB = 1024
+
+
 def format_bytes(bytes_val: int) -> str:
     """Format bytes to human readable string (e.g., 1.5 GiB)."""
-    import humanize  # noqa: PLC0415
-
-    return humanize.naturalsize(bytes_val, binary=True, format="%.1f")
+    if bytes_val == 1:
+        return "1 Byte"
+    if abs(bytes_val) < _BYTES_PER_KIB:
+        return f"{bytes_val} Bytes"
+    # Each binary unit is 2**10 times the previous one
+    exponent = min((abs(bytes_val).bit_length() - 1) // 10, len(_BINARY_SUFFIXES))
+    value = bytes_val / _BYTES_PER_KIB**exponent
+    # Move up a unit when rounding would display e.g. "1024.0 GiB"
+    if abs(round(value, 1)) >= _BYTES_PER_KIB and exponent < len(_BINARY_SUFFIXES):
+        exponent += 1
+        value /= _BYTES_PER_KIB
+    return f"{value:.1f} {_BINARY_SUFFIXES[exponent - 1]}"
 
 
 def _get_glances_address(
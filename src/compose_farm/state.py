@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import contextlib
+import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Mapping
+    from pathlib import Path
 
     from .config import Config
 
+# Parsed state per file, keyed on (mtime_ns, size) so the web UI's frequent
+# polls skip YAML parsing while the file is unchanged
+_state_cache: dict[Path, tuple[tuple[int, int], dict[str, str | list[str]]]] = {}
+
 
 def group_stacks_by_host(
     stacks: dict[str, str | list[str]],
@@ -54,14 +61,23 @@ def load_state(config: Config) -> dict[str, str | list[str]]:
     import yaml  # noqa: PLC0415
 
     state_path = config.get_state_path()
-    if not state_path.exists():
+    try:
+        stat = state_path.stat()
+    except FileNotFoundError:
         return {}
 
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _state_cache.get(state_path)
+    if cached is not None and cached[0] == key:
+        # Shallow copy: callers may modify the mapping before saving it
+        return dict(cached[1])
+
     with state_path.open() as f:
         data: dict[str, Any] = yaml.safe_load(f) or {}
 
     deployed: dict[str, str | list[str]] = data.get("deployed", {})
-    return deployed
+    _state_cache[state_path] = (key, deployed)
+    return dict(deployed)
 
 
 def _sorted_dict(d: dict[str, str | list[str]]) -> dict[str, str | list[str]]:
@@ -72,12 +88,55 @@ def _sorted_dict(d: dict[str, str | list[str]]) -> dict[str, str | list[str]]:
     }
 
 
+# Names that YAML emits as plain scalars (anything else falls back to PyYAML)
+_PLAIN_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+_YAML_KEYWORDS = frozenset(("y", "n", "yes", "no", "on", "off", "true", "false", "null"))
+
+
+def _is_plain_name(value: object) -> bool:
+    return (
+        isinstance(value, str)
+        and _PLAIN_NAME.fullmatch(value) is not None
+        and value.lower() not in _YAML_KEYWORDS
+    )
+
+
+def dump_deployed(deployed: dict[str, str | list[str]]) -> str:
+    """Render state as YAML text, matching ``yaml.dump({"deployed": ...})``.
+
+    Stack and host names are almost always plain identifiers, so they are
+    written directly instead of going through PyYAML's pure-Python emitter.
+    """
+    lines = ["deployed:"]
+    for stack, hosts in deployed.items():
+        if not _is_plain_name(stack):
+            break
+        if isinstance(hosts, list):
+            if not hosts or not all(_is_plain_name(h) for h in hosts):
+                break
+            lines.append(f"  {stack}:")
+            lines.extend(f"  - {h}" for h in hosts)
+        elif _is_plain_name(hosts):
+            lines.append(f"  {stack}: {hosts}")
+        else:
+            break
+    else:
+        if deployed:
+            return "\n".join(lines) + "\n"
+
+    # Lazy import: PyYAML is only needed for names that require quoting.
+    import yaml  # noqa: PLC0415
+
+    return yaml.dump({"deployed": deployed}, default_flow_style=False, sort_keys=False)
+
+
 def save_state(config: Config, deployed: dict[str, str | list[str]]) -> None:
     """Save the deployment state."""
     # Lazy import: PyYAML is only needed when state files are read or written.
     import yaml  # noqa: PLC0415
 
     state_path = config.get_state_path()
+    _state_cache.pop(state_path, None)
     with state_path.open("w") as f:
         yaml.safe_dump({"deployed": _sorted_dict(deployed)}, f, sort_keys=False)
 
@@ -95,10 +154,11 @@ def get_stack_host(config: Config, stack: str) -> str | None:
 
     For multi-host stacks, returns the first host or None.
     """
-    state = load_state(config)
-    value = state.get(stack)
-    if value is None:
-        return None
+    return _first_host(load_state(config).get(stack))
+
+
+def _first_host(value: str | list[str] | None) -> str | None:
+    """Return the host of a state entry (first host for multi-host stacks)."""
     if isinstance(value, list):
         return value[0] if value else None
     return value
@@ -163,6 +223,7 @@ def get_stacks_needing_migration(config: Config) -> list[str]:
 
     Multi-host stacks are never considered for migration.
     """
+    state = load_state(config)
     needs_migration = []
     for stack in config.stacks:
         # Skip multi-host stacks
@@ -170,7 +231,7 @@ def get_stacks_needing_migration(config: Config) -> list[str]:
             continue
 
         configured_host = config.get_hosts(stack)[0]
-        current_host = get_stack_host(config, stack)
+        current_host = _first_host(state.get(stack))
         if current_host and current_host != configured_host:
             needs_migration.append(stack)
     return needs_migration
@@ -196,3 +257,51 @@ def get_stacks_not_in_state(config: Config) -> list[str]:
     """
     state = load_state(config)
     return [stack for stack in config.stacks if stack not in state]
+
+
+@dataclass
+class DashboardSnapshot:
+    """Everything the web dashboard derives from config and state."""
+
+    deployed: dict[str, str | list[str]]
+    running_count: int
+    stopped_count: int
+    orphaned: dict[str, str | list[str]]
+    migrations: list[str]
+    not_started: list[str]
+    stacks_by_host: dict[str, list[str]]
+
+
+def compute_dashboard(config: Config) -> DashboardSnapshot:
+    """Classify all stacks against the state file in a single pass.
+
+    Equivalent to calling get_orphaned_stacks, get_stacks_needing_migration,
+    get_stacks_not_in_state and group_running_stacks_by_host, but loads the
+    state once and walks the configured stacks once.
+    """
+    deployed = load_state(config)
+    running_count = 0
+    migrations: list[str] = []
+    not_started: list[str] = []
+    for stack in config.stacks:
+        if stack not in deployed:
+            not_started.append(stack)
+            continue
+        running_count += 1
+        configured_hosts = config.get_hosts(stack)
+        # Multi-host stacks are never considered for migration
+        if len(configured_hosts) > 1:
+            continue
+        current_host = _first_host(deployed[stack])
+        if current_host and current_host != configured_hosts[0]:
+            migrations.append(stack)
+
+    return DashboardSnapshot(
+        deployed=deployed,
+        running_count=running_count,
+        stopped_count=len(config.stacks) - running_count,
+        orphaned={s: h for s, h in deployed.items() if s not in config.stacks},
+        migrations=migrations,
+        not_started=not_started,
+        stacks_by_host=group_running_stacks_by_host(deployed, config.hosts),
+    )
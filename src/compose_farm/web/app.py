@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any, cast
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import ValidationError
 from rich.logging import RichHandler
+from starlette.datastructures import MutableHeaders
 
-from compose_farm.web.deps import STATIC_DIR, get_config
+from compose_farm.executor import close_ssh_connections
+from compose_farm.web.deps import STATIC_DIR, get_config, precompile_templates
 from compose_farm.web.routes import actions, api, containers, pages
 from compose_farm.web.streaming import TASK_TTL_SECONDS, cleanup_stale_tasks
 from compose_farm.web.ws import router as ws_router
@@ -29,7 +32,7 @@ logging.basicConfig(
 logging.getLogger("compose_farm.web").setLevel(logging.INFO)
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Awaitable, Callable
 
 
 async def _task_cleanup_loop() -> None:
@@ -39,12 +42,44 @@ async def _task_cleanup_loop() -> None:
         cleanup_stale_tasks()
 
 
+async def _etag_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Answer unchanged HTML pages and partials with 304 Not Modified.
+
+    HTMX polls the dashboard partials every few seconds and their content rarely
+    changes, so an ETag lets the browser revalidate instead of downloading again.
+    """
+    response = await call_next(request)
+    if (
+        request.method != "GET"
+        or response.status_code != 200  # noqa: PLR2004
+        or not response.headers.get("content-type", "").startswith("text/html")
+    ):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    # Copy the raw list so repeated headers (e.g. several Set-Cookie) stay separate
+    headers = MutableHeaders(raw=list(response.headers.raw))
+    headers["etag"] = etag
+    headers.setdefault("cache-control", "no-cache")
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        if "content-length" in headers:  # Streaming responses don't set one
+            del headers["content-length"]
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, status_code=response.status_code, headers=headers)
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
     # Startup: pre-load config (ignore errors - handled per-request)
     with suppress(ValidationError, FileNotFoundError):
         get_config()
+    precompile_templates()
 
     # Start background cleanup task
     cleanup_task = asyncio.create_task(_task_cleanup_loop())
@@ -56,6 +91,10 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     with suppress(asyncio.CancelledError):
         await cleanup_task
 
+    # Shutdown: close pooled registry and SSH connections
+    await containers.close_registry_client()
+    await close_ssh_connections()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -65,6 +104,10 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Revalidate HTML responses via ETag (registered first so GZip wraps it and
+    # the tag is computed over the uncompressed body)
+    app.middleware("http")(_etag_middleware)
+
     # Enable Gzip compression for faster transfers over slow networks
     app.add_middleware(cast("Any", GZipMiddleware), minimum_size=1000)
 
@@ -6,6 +6,8 @@ between app.py and route modules.
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,9 +32,24 @@ def get_config() -> Config:
     return load_config()
 
 
+@lru_cache(maxsize=1)
 def get_templates() -> Jinja2Templates:
-    """Get Jinja2 templates instance."""
-    return Jinja2Templates(directory=str(TEMPLATES_DIR))
+    """Get the shared Jinja2 templates instance.
+
+    Reusing one environment keeps compiled templates cached between requests.
+    """
+    templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+    # Templates only change while developing with `cf web --reload`; otherwise
+    # skip Jinja's per-render stat of every template file
+    templates.env.auto_reload = os.environ.get("CF_WEB_RELOAD") == "1"
+    return templates
+
+
+def precompile_templates() -> None:
+    """Compile all templates up front so the first requests don't pay for it."""
+    env = get_templates().env
+    for name in env.list_templates(extensions=["html"]):
+        env.get_template(name)
 
 
 def extract_config_error(exc: Exception) -> str:
@@ -12,7 +12,12 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
 
 from compose_farm.web.deps import get_config
-from compose_farm.web.streaming import run_cli_streaming, run_compose_streaming, tasks
+from compose_farm.web.streaming import (
+    new_task,
+    run_cli_streaming,
+    run_compose_streaming,
+    tasks,
+)
 
 router = APIRouter(tags=["actions"])
 
@@ -23,7 +28,7 @@ _background_tasks: set[asyncio.Task[None]] = set()
 def _start_task(coro_factory: Callable[[str], Coroutine[Any, Any, None]]) -> str:
     """Create a task, register it, and return the task_id."""
     task_id = str(uuid.uuid4())
-    tasks[task_id] = {"status": "running", "output": []}
+    tasks[task_id] = new_task()
 
     task: asyncio.Task[None] = asyncio.create_task(coro_factory(task_id))
     _background_tasks.add(task)
@@ -31,10 +31,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["api"])
 
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def _validate_yaml(content: str) -> None:
     """Validate YAML content, raise HTTPException on error."""
     try:
-        yaml.safe_load(content)
+        yaml.load(content, Loader=_SafeLoader)  # noqa: S506
     except yaml.YAMLError as e:
         raise HTTPException(status_code=400, detail=f"Invalid YAML: {e}") from e
 
@@ -155,7 +159,7 @@ async def _get_container_states(
 
     # Build state map: name -> (state, exit_code)
     state_map: dict[str, tuple[str, int]] = {}
-    for line in result.stdout.strip().split("\n"):
+    for line in result.stdout.splitlines():
         if line.strip():
             with contextlib.suppress(json.JSONDecodeError):
                 data = json.loads(line)
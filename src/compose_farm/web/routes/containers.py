@@ -2,28 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
 import html
-import re
-from typing import TYPE_CHECKING
+import logging
+import string
+import time
+from functools import lru_cache
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import quote
 
+import httpx
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 
-from compose_farm.executor import TTLCache
-from compose_farm.glances import ContainerStats, fetch_all_container_stats, format_bytes
-from compose_farm.registry import DOCKER_HUB_ALIASES, ImageRef
+from compose_farm.executor import TTLCache, get_container_compose_labels
+from compose_farm.glances import (
+    ContainerStats,
+    _get_glances_address,
+    fetch_all_container_stats,
+    fetch_container_stats,
+    format_bytes,
+)
+from compose_farm.registry import DOCKER_HUB_ALIASES, ImageRef, check_image_updates
 from compose_farm.web.deps import get_config, get_templates
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["containers"])
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+
+    from compose_farm.config import Config
     from compose_farm.registry import TagCheckResult
 
 # Cache registry update checks for 5 minutes (300 seconds)
 # Registry calls are slow and often rate-limited
 _update_check_cache = TTLCache(ttl_seconds=300.0)
 
+# In-flight registry checks keyed by "image:tag", so concurrent per-host
+# batches that share an image wait on one lookup instead of repeating it
+_inflight_update_checks: dict[str, asyncio.Task[str]] = {}
+
+# Cache Glances container stats for 2 seconds so dashboards polling at the
+# same time (multiple tabs or users) share one Glances request per host
+_container_stats_cache = TTLCache(ttl_seconds=2.0)
+# Glances fetches still running, by cache key; concurrent misses join them
+_inflight_container_stats: dict[str, asyncio.Task[Any]] = {}
+
+_T = TypeVar("_T")
+
+# Cache key for the aggregate (all hosts) fetch; "all" is a reserved host name
+_ALL_HOSTS_KEY = "all"
+
 # Minimum parts needed to infer stack/service from container name
 MIN_NAME_PARTS = 2
 
@@ -31,6 +63,7 @@ MIN_NAME_PARTS = 2
 _DASH_HTML = '<span class="text-xs opacity-50">-</span>'
 
 
+@lru_cache(maxsize=512)
 def _parse_image(image: str) -> tuple[str, str]:
     """Parse image string into (name, tag)."""
     # Handle registry prefix (e.g., ghcr.io/user/repo:tag)
@@ -44,6 +77,7 @@ def _parse_image(image: str) -> tuple[str, str]:
     return image, "latest"
 
 
+@lru_cache(maxsize=2048)
 def _infer_stack_service(name: str) -> tuple[str, str]:
     """Fallback: infer stack and service from container name.
 
@@ -66,25 +100,40 @@ def _infer_stack_service(name: str) -> tuple[str, str]:
     return name, name
 
 
+@lru_cache(maxsize=8)
+def _render_containers_page(glances_enabled: bool, hosts: tuple[str, ...]) -> str:
+    """Render the dashboard shell; it only depends on Glances and the host list."""
+    template = get_templates().get_template("containers.html")
+    return template.render(glances_enabled=glances_enabled, hosts=list(hosts))
+
+
 @router.get("/live-stats", response_class=HTMLResponse)
-async def containers_page(request: Request) -> HTMLResponse:
+async def containers_page() -> HTMLResponse:
     """Container dashboard page."""
     config = get_config()
-    templates = get_templates()
 
     # Check if Glances is configured
     glances_enabled = config.glances_stack is not None
+    hosts = tuple(sorted(config.hosts)) if glances_enabled else ()
+
+    if get_templates().env.auto_reload:
+        # Templates are being edited (`cf web --reload`), so cached HTML may be stale
+        return HTMLResponse(_render_containers_page.__wrapped__(glances_enabled, hosts))
+    return HTMLResponse(_render_containers_page(glances_enabled, hosts))
+
+
+_UPTIME_MULTIPLIERS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,
+    "year": 31536000,
+}
 
-    return templates.TemplateResponse(
-        request,
-        "containers.html",
-        {
-            "request": request,
-            "glances_enabled": glances_enabled,
-            "hosts": sorted(config.hosts.keys()) if glances_enabled else [],
-        },
-    )
-
+# Words used in place of the number 1 ("an hour", "a day")
+_UPTIME_ONE_WORDS = frozenset(("a", "an"))
 
 _STATUS_CLASSES = {
     "running": "badge badge-success badge-sm",
@@ -93,6 +142,7 @@ _STATUS_CLASSES = {
 }
 
 
+@lru_cache(maxsize=64)
 def _status_class(status: str) -> str:
     """Get CSS class for status badge."""
     return _STATUS_CLASSES.get(status.lower(), "badge badge-ghost badge-sm")
@@ -107,19 +157,25 @@ def _progress_class(percent: float) -> str:
     return "bg-success"
 
 
-def _render_update_cell(image: str, tag: str) -> str:
-    """Render update check cell with client-side batch updates."""
+@lru_cache(maxsize=1024)
+def _update_cell_open_tag(image: str, tag: str) -> str:
+    """Render the opening <td> of an update cell (image/tag pairs repeat across rows)."""
     encoded_image = quote(image, safe="")
     encoded_tag = quote(tag, safe="")
-    cached_html = _update_check_cache.get(f"{image}:{tag}")
-    inner = cached_html if cached_html is not None else _DASH_HTML
     return (
         f"""<td class="update-cell whitespace-nowrap" """
         f"""data-image="{encoded_image}" data-tag="{encoded_tag}">"""
-        f"{inner}</td>"
     )
 
 
+def _render_update_cell(image: str, tag: str) -> str:
+    """Render update check cell with client-side batch updates."""
+    cached_html = _update_check_cache.get(f"{image}:{tag}")
+    inner = cached_html if cached_html is not None else _DASH_HTML
+    return f"{_update_cell_open_tag(image, tag)}{inner}</td>"
+
+
+@lru_cache(maxsize=512)
 def _image_web_url(image: str) -> str | None:
     """Return a human-friendly registry URL for an image (without tag)."""
     ref = ImageRef.parse(image)
@@ -130,12 +186,18 @@ def _image_web_url(image: str) -> str | None:
     return f"https://{ref.registry}/{ref.full_name}"
 
 
-def _render_row(c: ContainerStats, idx: int | str) -> str:
-    """Render a single container as an HTML table row."""
+def _render_row(c: ContainerStats, idx: int | str, out: list[str]) -> None:
+    """Render a single container as an HTML table row, appending fragments to ``out``.
+
+    Callers join all rows once, instead of building and re-joining a large
+    string per row.
+    """
     image_name, tag = _parse_image(c.image)
-    inferred_stack, inferred_service = _infer_stack_service(c.name)
-    stack = c.stack or inferred_stack
-    service = c.service or inferred_service
+    stack, service = c.stack, c.service
+    if not stack or not service:
+        inferred_stack, inferred_service = _infer_stack_service(c.name)
+        stack = stack or inferred_stack
+        service = service or inferred_service
 
     cpu = c.cpu_percent
     mem = c.memory_percent
@@ -149,7 +211,6 @@ def _render_row(c: ContainerStats, idx: int | str) -> str:
 
     uptime_sec = _parse_uptime_seconds(c.uptime)
     actions = _render_actions(stack)
-    update_cell = _render_update_cell(image_name, tag)
     image_label = f"{image_name}:{tag}"
     image_url = _image_web_url(image_name)
     if image_url:
@@ -160,19 +221,24 @@ def _render_row(c: ContainerStats, idx: int | str) -> str:
         )
     else:
         image_html = f'<code class="text-xs bg-base-200 px-1 rounded">{image_label}</code>'
-    # Render as single line to avoid whitespace nodes in DOM
+    # Render as single line to avoid whitespace nodes in DOM. Text data-sort
+    # values are kept as-is; the client compares them case-insensitively.
     row_id = f"c-{c.host}-{c.name}"
     class_attr = f' class="{row_class}"' if row_class else ""
-    return (
+    out.append(
         f'<tr id="{row_id}" data-host="{c.host}"{class_attr}><td class="text-xs opacity-50">{idx}</td>'
-        f'<td data-sort="{stack.lower()}"><a href="/stack/{stack}" class="link link-hover link-primary" hx-boost="true">{stack}</a></td>'
-        f'<td data-sort="{service.lower()}" class="text-xs opacity-70">{service}</td>'
+        f'<td data-sort="{stack}"><a href="/stack/{stack}" class="link link-hover link-primary" hx-boost="true">{stack}</a></td>'
+        f'<td data-sort="{service}" class="text-xs opacity-70">{service}</td>'
         f"<td>{actions}</td>"
-        f'<td data-sort="{c.host.lower()}"><span class="badge badge-outline badge-xs">{c.host}</span></td>'
-        f'<td data-sort="{c.image.lower()}">{image_html}</td>'
-        f"{update_cell}"
-        f'<td data-sort="{c.status.lower()}"><span class="{_status_class(c.status)}">{c.status}</span></td>'
+        f'<td data-sort="{c.host}"><span class="badge badge-outline badge-xs">{c.host}</span></td>'
+        f'<td data-sort="{c.image}">{image_html}</td>'
+    )
+    out.append(_render_update_cell(image_name, tag))
+    out.append(
+        f'<td data-sort="{c.status}"><span class="{_status_class(c.status)}">{c.status}</span></td>'
         f'<td data-sort="{uptime_sec}" class="text-xs text-right font-mono">{c.uptime or "-"}</td>'
+    )
+    out.append(
         f'<td data-sort="{cpu}" class="text-right font-mono"><div class="flex flex-col items-end gap-0.5"><div class="w-12 h-2 bg-base-300 rounded-full overflow-hidden"><div class="h-full {cpu_class}" style="width: {min(cpu, 100)}%"></div></div><span class="text-xs">{cpu:.0f}%</span></div></td>'
         f'<td data-sort="{c.memory_usage}" class="text-right font-mono"><div class="flex flex-col items-end gap-0.5"><div class="w-12 h-2 bg-base-300 rounded-full overflow-hidden"><div class="h-full {mem_class}" style="width: {min(mem, 100)}%"></div></div><span class="text-xs">{format_bytes(c.memory_usage)}</span></div></td>'
         f'<td data-sort="{c.network_rx + c.network_tx}" class="text-xs text-right font-mono">↓{format_bytes(c.network_rx)} ↑{format_bytes(c.network_tx)}</td>'
@@ -187,31 +253,75 @@ def _render_actions(stack: str) -> str:
 </button>"""
 
 
+def _uptime_tokens(uptime: str) -> Iterator[str]:
+    """Split an uptime into words, separating counts glued to their unit ("2days")."""
+    for token in uptime.lower().replace(",", " ").split():
+        unit = token.lstrip(string.digits)
+        if unit and unit != token:
+            yield token[: len(token) - len(unit)]
+            yield unit
+        else:
+            yield token
+
+
 def _parse_uptime_seconds(uptime: str) -> int:
     """Parse uptime string to seconds for sorting."""
     if not uptime:
         return 0
-    uptime = uptime.lower().strip()
-    # Handle "a/an" as 1
-    uptime = uptime.replace("an ", "1 ").replace("a ", "1 ")
-
+    # Uptimes are short "<number> <unit>" pairs, so a split is cheaper than a regex scan
     total = 0
-    multipliers = {
-        "second": 1,
-        "minute": 60,
-        "hour": 3600,
-        "day": 86400,
-        "week": 604800,
-        "month": 2592000,
-        "year": 31536000,
-    }
-    for match in re.finditer(r"(\d+)\s*(\w+)", uptime):
-        num = int(match.group(1))
-        unit = match.group(2).rstrip("s")  # Remove plural 's'
-        total += num * multipliers.get(unit, 0)
+    for num, unit in pairwise(_uptime_tokens(uptime)):
+        if num.isdecimal():
+            count = int(num)
+        elif num in _UPTIME_ONE_WORDS:
+            count = 1
+        else:
+            continue
+        total += count * _UPTIME_MULTIPLIERS.get(unit.rstrip("s"), 0)
     return total
 
 
+async def _shared_stats_fetch(key: str, fetch: Callable[[], Coroutine[Any, Any, _T]]) -> _T:
+    """Run a Glances fetch for a cache key, joining the one already in flight."""
+    task = _inflight_container_stats.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _inflight_container_stats[key] = task
+        task.add_done_callback(lambda _: _inflight_container_stats.pop(key, None))
+    # Shield so one cancelled request doesn't abort the fetch for the others
+    result: _T = await asyncio.shield(task)
+    return result
+
+
+async def _load_host_containers(
+    host_name: str, glances_address: str
+) -> tuple[list[ContainerStats] | None, str | None]:
+    """Fetch container stats for a host from Glances and cache a successful result."""
+    containers, error = await fetch_container_stats(host_name, glances_address)
+    if containers is not None:
+        _container_stats_cache.set(host_name, containers)
+    return containers, error
+
+
+async def _fetch_host_containers(
+    host_name: str, glances_address: str
+) -> tuple[list[ContainerStats] | None, str | None]:
+    """Fetch container stats for a host, reusing a very recent result if available."""
+    cached: list[ContainerStats] | None = _container_stats_cache.get(host_name)
+    if cached is not None:
+        return cached, None
+    return await _shared_stats_fetch(
+        host_name, lambda: _load_host_containers(host_name, glances_address)
+    )
+
+
+async def _load_all_containers(config: Config) -> list[ContainerStats]:
+    """Fetch container stats for all hosts from Glances and cache them."""
+    containers = await fetch_all_container_stats(config)
+    _container_stats_cache.set(_ALL_HOSTS_KEY, containers)
+    return containers
+
+
 @router.get("/api/containers/rows", response_class=HTMLResponse)
 async def get_containers_rows() -> HTMLResponse:
     """Get container table rows as HTML for HTMX.
@@ -225,15 +335,19 @@ async def get_containers_rows() -> HTMLResponse:
             '<tr><td colspan="12" class="text-center text-error">Glances not configured</td></tr>'
         )
 
-    containers = await fetch_all_container_stats(config)
+    containers: list[ContainerStats] | None = _container_stats_cache.get(_ALL_HOSTS_KEY)
+    if containers is None:
+        containers = await _shared_stats_fetch(_ALL_HOSTS_KEY, lambda: _load_all_containers(config))
 
     if not containers:
         return HTMLResponse(
             '<tr><td colspan="12" class="text-center py-4 opacity-60">No containers found</td></tr>'
         )
 
-    rows = "\n".join(_render_row(c, i + 1) for i, c in enumerate(containers))
-    return HTMLResponse(rows)
+    out: list[str] = []
+    for i, c in enumerate(containers):
+        _render_row(c, i + 1, out)
+    return HTMLResponse("".join(out))
 
 
 @router.get("/api/containers/rows/{host_name}", response_class=HTMLResponse)
@@ -243,13 +357,6 @@ async def get_containers_rows_by_host(host_name: str) -> HTMLResponse:
     Returns immediately with Glances data. Stack/service are inferred from
     container names for instant display (no SSH wait).
     """
-    import logging  # noqa: PLC0415
-    import time  # noqa: PLC0415
-
-    from compose_farm.executor import get_container_compose_labels  # noqa: PLC0415
-    from compose_farm.glances import _get_glances_address, fetch_container_stats  # noqa: PLC0415
-
-    logger = logging.getLogger(__name__)
     config = get_config()
 
     if host_name not in config.hosts:
@@ -260,7 +367,7 @@ async def get_containers_rows_by_host(host_name: str) -> HTMLResponse:
     glances_address = _get_glances_address(host_name, host, config.glances_stack, local_host)
 
     t0 = time.monotonic()
-    containers, error = await fetch_container_stats(host_name, glances_address)
+    containers, error = await _fetch_host_containers(host_name, glances_address)
     t1 = time.monotonic()
     fetch_ms = (t1 - t0) * 1000
 
@@ -290,7 +397,10 @@ async def get_containers_rows_by_host(host_name: str) -> HTMLResponse:
     containers = [c for c in containers if not c.stack or c.stack in config.stacks]
 
     # Use placeholder index (will be renumbered by JS after all hosts load)
-    rows = "\n".join(_render_row(c, "-") for c in containers)
+    out: list[str] = []
+    for c in containers:
+        _render_row(c, "-", out)
+    rows = "".join(out)
     t2 = time.monotonic()
     render_ms = (t2 - t1) * 1000
 
@@ -304,6 +414,18 @@ async def get_containers_rows_by_host(host_name: str) -> HTMLResponse:
     return HTMLResponse(rows)
 
 
+# Update badge markup; only the tooltip and count vary between renders
+_UPDATES_BADGE_TEMPLATE = (
+    '<span class="tooltip whitespace-nowrap" data-tip="{tip}">'
+    '<span class="badge badge-warning badge-xs cursor-help whitespace-nowrap">'
+    "{count} new</span>"
+    "</span>"
+)
+_UP_TO_DATE_HTML = (
+    '<span class="tooltip" data-tip="Up to date"><span class="text-success text-xs">✓</span></span>'
+)
+
+
 def _render_update_badge(result: TagCheckResult) -> str:
     if result.error:
         return _DASH_HTML
@@ -311,14 +433,62 @@ def _render_update_badge(result: TagCheckResult) -> str:
         updates = result.available_updates
         count = len(updates)
         title = f"Newer: {', '.join(updates[:3])}" + ("..." if count > 3 else "")  # noqa: PLR2004
-        tip = html.escape(title, quote=True)
-        return (
-            f'<span class="tooltip whitespace-nowrap" data-tip="{tip}">'
-            f'<span class="badge badge-warning badge-xs cursor-help whitespace-nowrap">'
-            f"{count} new</span>"
-            "</span>"
+        # Tag names come from the registry, so escape them for the attribute
+        return _UPDATES_BADGE_TEMPLATE.format(tip=html.escape(title, quote=True), count=count)
+    return _UP_TO_DATE_HTML
+
+
+_registry_client: httpx.AsyncClient | None = None
+
+
+def _get_registry_client() -> httpx.AsyncClient:
+    """Return the shared registry HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to registries alive across update
+    checks instead of paying a TCP+TLS handshake per request.
+    """
+    global _registry_client
+    if _registry_client is None or _registry_client.is_closed:
+        _registry_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
         )
-    return '<span class="tooltip" data-tip="Up to date"><span class="text-success text-xs">✓</span></span>'
+    return _registry_client
+
+
+async def close_registry_client() -> None:
+    """Close the shared registry HTTP client (called on app shutdown)."""
+    global _registry_client
+    if _registry_client is not None:
+        await _registry_client.aclose()
+        _registry_client = None
+
+
+async def _fetch_update_html(full_image: str, client: httpx.AsyncClient) -> str:
+    """Query the registry for updates and cache the rendered badge."""
+    try:
+        result = await check_image_updates(full_image, client)
+        html = _render_update_badge(result)
+        _update_check_cache.set(full_image, html)
+    except Exception:
+        _update_check_cache.set(full_image, _DASH_HTML, ttl_seconds=60.0)
+        html = _DASH_HTML
+    return html
+
+
+async def _check_update_html(full_image: str, client: httpx.AsyncClient) -> str:
+    """Return the update badge for an image, sharing in-flight registry checks."""
+    cached_html: str | None = _update_check_cache.get(full_image)
+    if cached_html is not None:
+        return cached_html
+
+    task = _inflight_update_checks.get(full_image)
+    if task is None:
+        task = asyncio.create_task(_fetch_update_html(full_image, client))
+        _inflight_update_checks[full_image] = task
+        task.add_done_callback(lambda _: _inflight_update_checks.pop(full_image, None))
+    # Shield so one cancelled request doesn't abort the lookup for the others
+    return await asyncio.shield(task)
 
 
 @router.post("/api/containers/check-updates", response_class=JSONResponse)
@@ -328,8 +498,6 @@ async def check_container_updates_batch(request: Request) -> JSONResponse:
     Payload: {"items": [{"image": "...", "tag": "..."}, ...]}
     Returns: {"results": [{"image": "...", "tag": "...", "html": "..."}, ...]}
     """
-    import httpx  # noqa: PLC0415
-
     payload = await request.json()
     items = payload.get("items", []) if isinstance(payload, dict) else []
     if not items:
@@ -337,35 +505,21 @@ async def check_container_updates_batch(request: Request) -> JSONResponse:
 
     results = []
 
-    from compose_farm.registry import check_image_updates  # noqa: PLC0415
-
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for item in items:
-            image = item.get("image", "")
-            tag = item.get("tag", "")
-            full_image = f"{image}:{tag}"
-            if not image or not tag:
-                results.append({"image": image, "tag": tag, "html": _DASH_HTML})
-                continue
-
-            # NOTE: Tag-based checks cannot detect digest changes for moving tags
-            # like "latest". A future improvement could compare remote vs local
-            # digests using dockerfarm-log.toml (from `cf refresh`) or a per-host
-            # digest lookup.
-
-            cached_html: str | None = _update_check_cache.get(full_image)
-            if cached_html is not None:
-                results.append({"image": image, "tag": tag, "html": cached_html})
-                continue
-
-            try:
-                result = await check_image_updates(full_image, client)
-                html = _render_update_badge(result)
-                _update_check_cache.set(full_image, html)
-            except Exception:
-                _update_check_cache.set(full_image, _DASH_HTML, ttl_seconds=60.0)
-                html = _DASH_HTML
-
-            results.append({"image": image, "tag": tag, "html": html})
+    client = _get_registry_client()
+    for item in items:
+        image = item.get("image", "")
+        tag = item.get("tag", "")
+        full_image = f"{image}:{tag}"
+        if not image or not tag:
+            results.append({"image": image, "tag": tag, "html": _DASH_HTML})
+            continue
+
+        # NOTE: Tag-based checks cannot detect digest changes for moving tags
+        # like "latest". A future improvement could compare remote vs local
+        # digests using dockerfarm-log.toml (from `cf refresh`) or a per-host
+        # digest lookup.
+
+        html = await _check_update_html(full_image, client)
+        results.append({"image": image, "tag": tag, "html": html})
 
     return JSONResponse({"results": results})
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-import yaml
-from fastapi import APIRouter, Request
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
+
+from fastapi import APIRouter
 from fastapi.responses import HTMLResponse
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from compose_farm.compose import extract_services, get_container_name, parse_compose_data
 from compose_farm.paths import find_config_path
 from compose_farm.state import (
-    get_orphaned_stacks,
+    compute_dashboard,
+    dump_deployed,
     get_stack_host,
-    get_stacks_needing_migration,
-    get_stacks_not_in_state,
     group_running_stacks_by_host,
     load_state,
 )
@@ -25,14 +26,71 @@ from compose_farm.web.deps import (
     get_templates,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from pathlib import Path
+
 router = APIRouter()
 
+# Rendered partial HTML keyed on (template, frozen context). HTMX re-requests
+# the dashboard partials after every action even though their inputs rarely
+# change, so identical contexts skip the Jinja render.
+_PARTIAL_CACHE_SIZE = 64
+_partial_cache: dict[tuple[str, Hashable], str] = {}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a template context value into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, BaseModel):
+        return _freeze(value.model_dump())
+    return cast("Hashable", value)
+
+
+def _render_page(name: str, context: dict[str, Any]) -> HTMLResponse:
+    """Render a template to an HTML response."""
+    return HTMLResponse(get_templates().get_template(name).render(context))
+
+
+def _render_partial(name: str, context: dict[str, Any]) -> HTMLResponse:
+    """Render a partial template, reusing the HTML for an identical context."""
+    templates = get_templates()
+    if templates.env.auto_reload:
+        # Templates are being edited (`cf web --reload`), so cached HTML may be stale
+        return HTMLResponse(templates.get_template(name).render(context))
+    key = (name, _freeze(context))
+    html = _partial_cache.get(key)
+    if html is None:
+        html = templates.get_template(name).render(context)
+        if len(_partial_cache) >= _PARTIAL_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _partial_cache[next(iter(_partial_cache))]
+        _partial_cache[key] = html
+    return HTMLResponse(html)
+
+
+@lru_cache(maxsize=128)
+def _read_text_cached(path: Path, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    """Read a file; mtime and size are part of the key so edits invalidate it."""
+    return path.read_text()
+
+
+def _read_text_if_exists(path: Path) -> str:
+    """Read a file's text, or return "" if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ""
+    return _read_text_cached(path, stat.st_mtime_ns, stat.st_size)
+
 
 @router.get("/console", response_class=HTMLResponse)
-async def console(request: Request) -> HTMLResponse:
+async def console() -> HTMLResponse:
     """Console page with terminal and editor."""
     config = get_config()
-    templates = get_templates()
 
     # Sort hosts with local first
     local_host = get_local_host(config)
@@ -43,11 +101,9 @@ async def console(request: Request) -> HTMLResponse:
     # Get config path for default editor file
     config_path = str(config.config_path) if config.config_path else ""
 
-    return templates.TemplateResponse(
-        request,
+    return _render_page(
         "console.html",
         {
-            "request": request,
             "hosts": hosts,
             "local_host": local_host,
             "config_path": config_path,
@@ -56,10 +112,8 @@ async def console(request: Request) -> HTMLResponse:
 
 
 @router.get("/", response_class=HTMLResponse)
-async def index(request: Request) -> HTMLResponse:
+async def index() -> HTMLResponse:
     """Dashboard page - combined view of all cluster info."""
-    templates = get_templates()
-
     # Try to load config, handle errors gracefully
     config_error = None
     try:
@@ -69,13 +123,11 @@ async def index(request: Request) -> HTMLResponse:
 
         # Read raw config content for the editor
         config_path = find_config_path()
-        config_content = config_path.read_text() if config_path else ""
+        config_content = _read_text_if_exists(config_path) if config_path else ""
 
-        return templates.TemplateResponse(
-            request,
+        return _render_page(
             "index.html",
             {
-                "request": request,
                 "config_error": config_error,
                 "hosts": {},
                 "stacks": {},
@@ -90,34 +142,18 @@ async def index(request: Request) -> HTMLResponse:
             },
         )
 
-    # Get state
-    deployed = load_state(config)
-
-    # Stats (only count stacks that are both in config AND deployed)
-    running_count = sum(1 for stack in deployed if stack in config.stacks)
-    stopped_count = len(config.stacks) - running_count
-
-    # Pending operations
-    orphaned = get_orphaned_stacks(config)
-    migrations = get_stacks_needing_migration(config)
-    not_started = get_stacks_not_in_state(config)
-
-    # Group stacks by host (filter out hosts with no running stacks)
-    stacks_by_host = group_running_stacks_by_host(deployed, config.hosts)
+    # State, stats, pending operations and stacks by host in one pass
+    snapshot = compute_dashboard(config)
 
     # Config file content
-    config_content = ""
-    if config.config_path and config.config_path.exists():
-        config_content = config.config_path.read_text()
+    config_content = _read_text_if_exists(config.config_path) if config.config_path else ""
 
     # State file content
-    state_content = yaml.dump({"deployed": deployed}, default_flow_style=False, sort_keys=False)
+    state_content = dump_deployed(snapshot.deployed)
 
-    return templates.TemplateResponse(
-        request,
+    return _render_page(
         "index.html",
         {
-            "request": request,
             "config_error": None,
             # Config data
             "hosts": config.hosts,
@@ -126,37 +162,33 @@ async def index(request: Request) -> HTMLResponse:
             # State data
             "state_content": state_content,
             # Stats
-            "running_count": running_count,
-            "stopped_count": stopped_count,
+            "running_count": snapshot.running_count,
+            "stopped_count": snapshot.stopped_count,
             # Pending operations
-            "orphaned": orphaned,
-            "migrations": migrations,
-            "not_started": not_started,
+            "orphaned": snapshot.orphaned,
+            "migrations": snapshot.migrations,
+            "not_started": snapshot.not_started,
             # Stacks by host
-            "stacks_by_host": stacks_by_host,
+            "stacks_by_host": snapshot.stacks_by_host,
         },
     )
 
 
 @router.get("/stack/{name}", response_class=HTMLResponse)
-async def stack_detail(request: Request, name: str) -> HTMLResponse:
+async def stack_detail(name: str) -> HTMLResponse:
     """Stack detail page."""
     config = get_config()
-    templates = get_templates()
 
     # Get compose file content
     compose_path = config.get_compose_path(name)
-    compose_content = ""
-    if compose_path and compose_path.exists():
-        compose_content = compose_path.read_text()
+    compose_content = _read_text_if_exists(compose_path) if compose_path else ""
 
     # Get .env file content
     env_content = ""
     env_path = None
     if compose_path:
         env_path = compose_path.parent / ".env"
-        if env_path.exists():
-            env_content = env_path.read_text()
+        env_content = _read_text_if_exists(env_path)
 
     # Get host info
     hosts = config.get_hosts(name)
@@ -187,11 +219,9 @@ async def stack_detail(request: Request, name: str) -> HTMLResponse:
     # Extract website URLs from Traefik labels
     website_urls = extract_website_urls(config, name)
 
-    return templates.TemplateResponse(
-        request,
+    return _render_page(
         "stack.html",
         {
-            "request": request,
             "name": name,
             "hosts": hosts,
             "current_host": current_host,
@@ -207,10 +237,9 @@ async def stack_detail(request: Request, name: str) -> HTMLResponse:
 
 
 @router.get("/partials/sidebar", response_class=HTMLResponse)
-async def sidebar_partial(request: Request) -> HTMLResponse:
+async def sidebar_partial() -> HTMLResponse:
     """Sidebar stack list partial."""
     config = get_config()
-    templates = get_templates()
 
     state = load_state(config)
 
@@ -220,11 +249,9 @@ async def sidebar_partial(request: Request) -> HTMLResponse:
         for svc, host_val in config.stacks.items()
     }
 
-    return templates.TemplateResponse(
-        request,
+    return _render_partial(
         "partials/sidebar.html",
         {
-            "request": request,
             "stacks": sorted(config.stacks.keys()),
             "stack_hosts": stack_hosts,
             "hosts": sorted(config.hosts.keys()),
@@ -234,36 +261,44 @@ async def sidebar_partial(request: Request) -> HTMLResponse:
     )
 
 
+@lru_cache(maxsize=4)
+def _config_error_at(path: Path | None, mtime_ns: int, size: int) -> str | None:  # noqa: ARG001
+    """Validate the config once per file version; return the error message, if any."""
+    try:
+        get_config()
+    except (ValidationError, FileNotFoundError) as e:
+        return extract_config_error(e)
+    return None
+
+
 @router.get("/partials/config-error", response_class=HTMLResponse)
-async def config_error_partial(request: Request) -> HTMLResponse:
+async def config_error_partial() -> HTMLResponse:
     """Config error banner partial."""
-    templates = get_templates()
+    path = find_config_path()
     try:
-        get_config()
+        stat = path.stat() if path else None
+    except OSError:
+        stat = None
+    key = (stat.st_mtime_ns, stat.st_size) if stat else (0, 0)
+    error = _config_error_at(path, *key)
+    if error is None:
         return HTMLResponse("")  # No error
-    except (ValidationError, FileNotFoundError) as e:
-        error = extract_config_error(e)
-        return templates.TemplateResponse(
-            request, "partials/config_error.html", {"request": request, "config_error": error}
-        )
+    return _render_page("partials/config_error.html", {"config_error": error})
 
 
 @router.get("/partials/stats", response_class=HTMLResponse)
-async def stats_partial(request: Request) -> HTMLResponse:
+async def stats_partial() -> HTMLResponse:
     """Stats cards partial."""
     config = get_config()
-    templates = get_templates()
 
     deployed = load_state(config)
     # Only count stacks that are both in config AND deployed
     running_count = sum(1 for stack in deployed if stack in config.stacks)
     stopped_count = len(config.stacks) - running_count
 
-    return templates.TemplateResponse(
-        request,
+    return _render_partial(
         "partials/stats.html",
         {
-            "request": request,
             "hosts": config.hosts,
             "stacks": config.stacks,
             "running_count": running_count,
@@ -273,42 +308,34 @@ async def stats_partial(request: Request) -> HTMLResponse:
 
 
 @router.get("/partials/pending", response_class=HTMLResponse)
-async def pending_partial(request: Request, expanded: bool = True) -> HTMLResponse:
+async def pending_partial(expanded: bool = True) -> HTMLResponse:
     """Pending operations partial."""
     config = get_config()
-    templates = get_templates()
 
-    orphaned = get_orphaned_stacks(config)
-    migrations = get_stacks_needing_migration(config)
-    not_started = get_stacks_not_in_state(config)
+    snapshot = compute_dashboard(config)
 
-    return templates.TemplateResponse(
-        request,
+    return _render_partial(
         "partials/pending.html",
         {
-            "request": request,
-            "orphaned": orphaned,
-            "migrations": migrations,
-            "not_started": not_started,
+            "orphaned": snapshot.orphaned,
+            "migrations": snapshot.migrations,
+            "not_started": snapshot.not_started,
             "expanded": expanded,
         },
     )
 
 
 @router.get("/partials/stacks-by-host", response_class=HTMLResponse)
-async def stacks_by_host_partial(request: Request, expanded: bool = True) -> HTMLResponse:
+async def stacks_by_host_partial(expanded: bool = True) -> HTMLResponse:
     """Stacks by host partial."""
     config = get_config()
-    templates = get_templates()
 
     deployed = load_state(config)
     stacks_by_host = group_running_stacks_by_host(deployed, config.hosts)
 
-    return templates.TemplateResponse(
-        request,
+    return _render_partial(
         "partials/stacks_by_host.html",
         {
-            "request": request,
             "hosts": config.hosts,
             "stacks_by_host": stacks_by_host,
             "expanded": expanded,
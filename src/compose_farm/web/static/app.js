@@ -100,10 +100,23 @@ window.getLanguageFromPath = getLanguageFromPath;
  */
 function createWebSocket(path) {
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-    return new WebSocket(`${protocol}//${window.location.host}${path}`);
+    const ws = new WebSocket(`${protocol}//${window.location.host}${path}`);
+    ws.binaryType = 'arraybuffer';
+    return ws;
 }
 window.createWebSocket = createWebSocket;
 
+/**
+ * Convert a WebSocket message into data for term.write()
+ * Binary frames carry raw terminal bytes; xterm.js decodes UTF-8 across writes.
+ * @param {string|ArrayBuffer} data - WebSocket message data
+ * @returns {string|Uint8Array}
+ */
+function terminalData(data) {
+    return typeof data === 'string' ? data : new Uint8Array(data);
+}
+window.terminalData = terminalData;
+
 /**
  * Wait for xterm.js to load, then execute callback
  * @param {function} callback - Function to call when xterm is ready
@@ -242,7 +255,7 @@ function initExecTerminal(stack, container, host) {
     const term = execTerminalWrapper.term;
 
     execWs.onopen = () => { sendSize(term.cols, term.rows); term.focus(); };
-    execWs.onmessage = (event) => term.write(event.data);
+    execWs.onmessage = (event) => term.write(terminalData(event.data));
     execWs.onclose = () => term.write(`${ANSI.CRLF}${ANSI.DIM}[Connection closed]${ANSI.RESET}${ANSI.CRLF}`);
     execWs.onerror = (error) => {
         term.write(`${ANSI.RED}[WebSocket Error]${ANSI.RESET}${ANSI.CRLF}`);
@@ -1169,7 +1182,7 @@ function doSort() {
 
         const aVal = a.cells[liveStats.sortCol]?.dataset?.sort ?? '';
         const bVal = b.cells[liveStats.sortCol]?.dataset?.sort ?? '';
-        const cmp = isNumeric ? aVal - bVal : aVal.localeCompare(bVal);
+        const cmp = isNumeric ? aVal - bVal : aVal.localeCompare(bVal, undefined, { sensitivity: 'base' });
         return liveStats.sortAsc ? cmp : -cmp;
     });
 
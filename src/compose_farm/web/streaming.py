@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import heapq
 import os
 import time
+from collections import deque
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from compose_farm.executor import build_ssh_command
@@ -21,12 +25,57 @@ DIM = "\x1b[2m"
 RESET = "\x1b[0m"
 CRLF = "\r\n"
 
+# Bytes read from a subprocess pipe per wakeup
+_READ_SIZE = 65536
+
+# Extra environment for cf subprocesses so their output renders like a terminal
+_TERMINAL_ENV = {"FORCE_COLOR": "1", "TERM": "xterm-256color", "COLUMNS": "120"}
+
+# Agent socket lookups stat the filesystem; forwarded sockets change when the
+# user reconnects, so results are only reused briefly
+_SSH_SOCK_TTL_SECONDS = 30.0
+_ssh_sock_cache: tuple[float, str | None] | None = None
+
 # In-memory task registry
 tasks: dict[str, dict[str, Any]] = {}
 
 # How long to keep completed tasks (10 minutes)
 TASK_TTL_SECONDS = 600
 
+# (completed_at, task_id) of finished tasks, oldest first, so cleanup only
+# looks at tasks that are actually due
+_completed: list[tuple[float, str]] = []
+
+# Output characters kept per task; the oldest chunks are dropped past this
+TASK_OUTPUT_MAX_CHARS = 1024 * 1024
+
+
+def new_task() -> dict[str, Any]:
+    """Create a task registry entry.
+
+    ``output`` holds the most recent chunks, ``size`` their total length, and
+    ``seq`` counts every chunk ever written, so readers can tell how many were
+    dropped from the front.
+    ``waiters`` holds one event per reader, set on new output or completion so
+    readers need not poll.
+    """
+    return {
+        "status": "running",
+        "output": deque(),
+        "size": 0,
+        "seq": 0,
+        "waiters": set(),
+    }
+
+
+def finish_task(task_id: str, *, success: bool) -> None:
+    """Mark a task as completed or failed and wake its readers."""
+    task = tasks[task_id]
+    task["status"] = "completed" if success else "failed"
+    task["completed_at"] = time.time()
+    _wake_readers(task)
+    heapq.heappush(_completed, (task["completed_at"], task_id))
+
 
 def cleanup_stale_tasks() -> int:
     """Remove tasks that completed more than TASK_TTL_SECONDS ago.
@@ -34,20 +83,60 @@ def cleanup_stale_tasks() -> int:
     Returns the number of tasks removed.
     """
     cutoff = time.time() - TASK_TTL_SECONDS
-    stale = [
-        tid
-        for tid, task in tasks.items()
-        if task.get("completed_at") and task["completed_at"] < cutoff
-    ]
-    for tid in stale:
-        tasks.pop(tid, None)
-    return len(stale)
+    removed = 0
+    while _completed and _completed[0][0] < cutoff:
+        _, tid = heapq.heappop(_completed)
+        if tasks.pop(tid, None) is not None:
+            removed += 1
+    return removed
+
 
+def _wake_readers(task: dict[str, Any]) -> None:
+    """Signal every reader of a task that it has new output or finished."""
+    for waiter in task["waiters"]:
+        waiter.set()
 
-async def stream_to_task(task_id: str, message: str) -> None:
+
+def _append_output(task: dict[str, Any], message: str) -> None:
+    """Append a message to a task entry's output and wake its readers."""
+    output = task["output"]
+    output.append(message)
+    task["size"] += len(message)
+    # Chunks are up to a full pipe read, so the buffer is bounded by size, not count
+    while task["size"] > TASK_OUTPUT_MAX_CHARS and len(output) > 1:
+        task["size"] -= len(output.popleft())
+    task["seq"] += 1
+    _wake_readers(task)
+
+
+def stream_to_task(task_id: str, message: str) -> None:
     """Send a message to a task's output buffer."""
-    if task_id in tasks:
-        tasks[task_id]["output"].append(message)
+    task = tasks.get(task_id)
+    if task is not None:
+        _append_output(task, message)
+
+
+def _ssh_auth_sock() -> str | None:
+    """Get the SSH agent socket, reusing a lookup from the last few seconds."""
+    global _ssh_sock_cache
+    now = time.monotonic()
+    if _ssh_sock_cache is None or now - _ssh_sock_cache[0] >= _SSH_SOCK_TTL_SECONDS:
+        _ssh_sock_cache = (now, get_ssh_auth_sock())
+    return _ssh_sock_cache[1]
+
+
+@lru_cache(maxsize=8)
+def _subprocess_env(ssh_sock: str | None, *, terminal: bool) -> dict[str, str]:
+    """Build a child environment once per agent socket instead of per command."""
+    env = {**os.environ, **_TERMINAL_ENV} if terminal else {**os.environ}
+    if ssh_sock:
+        env["SSH_AUTH_SOCK"] = ssh_sock
+    return env
+
+
+def _to_crlf(text: str) -> str:
+    """Convert LF line endings to CRLF for xterm.js."""
+    return text.replace("\r\n", "\n").replace("\n", CRLF)
 
 
 async def _stream_subprocess(task_id: str, args: list[str], env: dict[str, str]) -> int:
@@ -59,12 +148,16 @@ async def _stream_subprocess(task_id: str, args: list[str], env: dict[str, str])
         env=env,
     )
     if process.stdout:
-        async for line in process.stdout:
-            text = line.decode("utf-8", errors="replace")
-            # Convert \n to \r\n for xterm.js
-            if text.endswith("\n") and not text.endswith("\r\n"):
-                text = text[:-1] + "\r\n"
-            await stream_to_task(task_id, text)
+        # Look the task up once rather than per read
+        task = tasks[task_id]
+        # Forward whatever is buffered in one message instead of one per line;
+        # the incremental decoder keeps multi-byte characters split across reads
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while chunk := await process.stdout.read(_READ_SIZE):
+            if text := decoder.decode(chunk):
+                _append_output(task, _to_crlf(text))
+        if text := decoder.decode(b"", final=True):
+            _append_output(task, _to_crlf(text))
     return await process.wait()
 
 
@@ -76,21 +169,16 @@ async def run_cli_streaming(
     """Run a cf CLI command as subprocess and stream output to task buffer."""
     try:
         cmd = ["cf", *args, f"--config={config.config_path}"]
-        await stream_to_task(task_id, f"{DIM}$ {' '.join(['cf', *args])}{RESET}{CRLF}")
-
-        # Build environment with color support and SSH agent
-        env = {**os.environ, "FORCE_COLOR": "1", "TERM": "xterm-256color", "COLUMNS": "120"}
-        if ssh_sock := get_ssh_auth_sock():
-            env["SSH_AUTH_SOCK"] = ssh_sock
+        stream_to_task(task_id, f"{DIM}$ {' '.join(['cf', *args])}{RESET}{CRLF}")
 
+        # Environment with color support and SSH agent
+        env = _subprocess_env(_ssh_auth_sock(), terminal=True)
         exit_code = await _stream_subprocess(task_id, cmd, env)
-        tasks[task_id]["status"] = "completed" if exit_code == 0 else "failed"
-        tasks[task_id]["completed_at"] = time.time()
+        finish_task(task_id, success=exit_code == 0)
 
     except Exception as e:
-        await stream_to_task(task_id, f"{RED}Error: {e}{RESET}{CRLF}")
-        tasks[task_id]["status"] = "failed"
-        tasks[task_id]["completed_at"] = time.time()
+        stream_to_task(task_id, f"{RED}Error: {e}{RESET}{CRLF}")
+        finish_task(task_id, success=False)
 
 
 def _is_self_update(config: Config, stack: str, command: str) -> bool:
@@ -127,31 +215,29 @@ async def _run_cli_via_ssh(
             f"sleep 0.3 && tail -f {log_file} 2>/dev/null"
         )
 
-        await stream_to_task(task_id, f"{DIM}$ {cf_cmd}{RESET}{CRLF}")
-        await stream_to_task(task_id, f"{GREEN}Running via SSH (detached with setsid){RESET}{CRLF}")
+        stream_to_task(
+            task_id,
+            f"{DIM}$ {cf_cmd}{RESET}{CRLF}"
+            f"{GREEN}Running via SSH (detached with setsid){RESET}{CRLF}",
+        )
 
         ssh_args = build_ssh_command(host, remote_cmd, tty=False)
-        env = {**os.environ}
-        if ssh_sock := get_ssh_auth_sock():
-            env["SSH_AUTH_SOCK"] = ssh_sock
-
+        env = _subprocess_env(_ssh_auth_sock(), terminal=False)
         exit_code = await _stream_subprocess(task_id, ssh_args, env)
 
         # Exit code 255 = SSH closed (container died during down) - expected for self-updates
         if exit_code == 255:  # noqa: PLR2004
-            await stream_to_task(
+            stream_to_task(
                 task_id,
                 f"{CRLF}{GREEN}Container restarting... refresh the page in a few seconds.{RESET}{CRLF}",
             )
-            tasks[task_id]["status"] = "completed"
+            finish_task(task_id, success=True)
         else:
-            tasks[task_id]["status"] = "completed" if exit_code == 0 else "failed"
-        tasks[task_id]["completed_at"] = time.time()
+            finish_task(task_id, success=exit_code == 0)
 
     except Exception as e:
-        await stream_to_task(task_id, f"{RED}Error: {e}{RESET}{CRLF}")
-        tasks[task_id]["status"] = "failed"
-        tasks[task_id]["completed_at"] = time.time()
+        stream_to_task(task_id, f"{RED}Error: {e}{RESET}{CRLF}")
+        finish_task(task_id, success=False)
 
 
 async def run_compose_streaming(
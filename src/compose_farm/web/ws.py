@@ -13,12 +13,13 @@ import shlex
 import signal
 import struct
 import termios
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 import asyncssh
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from compose_farm.executor import ssh_connect_kwargs
+from compose_farm.executor import ssh_connect_kwargs, ssh_connection
 from compose_farm.web.deps import get_config, is_local_host
 from compose_farm.web.streaming import CRLF, DIM, GREEN, RED, RESET, tasks
 
@@ -27,7 +28,19 @@ logger = logging.getLogger(__name__)
 # Shell command to prefer bash over sh
 SHELL_FALLBACK = "command -v bash >/dev/null && exec bash || exec sh"
 
+# Max terminal output per websocket frame; bursts are drained up to this size
+_PTY_READ_SIZE = 65536
+
+# Fixed lines of the task terminal stream
+_TRUNCATED_NOTE = f"{DIM}[... earlier output truncated]{RESET}{CRLF}"
+_STATUS_MARKERS = {
+    "completed": f"{CRLF}{GREEN}[Done]{RESET}{CRLF}",
+    "failed": f"{CRLF}{RED}[Failed]{RESET}{CRLF}",
+}
+
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from compose_farm.config import Host
 
 router = APIRouter()
@@ -55,41 +68,101 @@ def _resize_pty(
         os.kill(proc.pid, signal.SIGWINCH)
 
 
+def _read_available(fd: int) -> bytes:
+    """Drain what a non-blocking PTY has buffered, up to _PTY_READ_SIZE bytes.
+
+    Raises BlockingIOError if nothing is available yet.
+    """
+    data = os.read(fd, _PTY_READ_SIZE)
+    while data and len(data) < _PTY_READ_SIZE:
+        try:
+            more = os.read(fd, _PTY_READ_SIZE - len(data))
+        except OSError:  # Nothing more for now; EIO at exit surfaces on the next read
+            break
+        if not more:
+            break
+        data += more
+    return data
+
+
+async def _wait_readable(fd: int) -> None:
+    """Wait on the event loop's selector until a non-blocking fd is readable."""
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Future[None] = loop.create_future()
+
+    def on_readable() -> None:
+        if not ready.done():
+            ready.set_result(None)
+
+    loop.add_reader(fd, on_readable)
+    try:
+        await ready
+    finally:
+        loop.remove_reader(fd)
+
+
+async def _relay_input(
+    websocket: WebSocket,
+    exited: Awaitable[object],
+    handle: Callable[[str], None],
+) -> None:
+    """Pass websocket messages to handle until the process exits.
+
+    Waits on both at once instead of polling the process between receives.
+    """
+    exit_task = asyncio.ensure_future(exited)
+    recv_task: asyncio.Task[str] | None = None
+    try:
+        while True:
+            recv_task = asyncio.create_task(websocket.receive_text())
+            done, _ = await asyncio.wait(
+                {recv_task, exit_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if recv_task in done:
+                handle(recv_task.result())
+            if exit_task in done:
+                return
+    finally:
+        for task in (recv_task, exit_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+
 async def _bridge_websocket_to_fd(
     websocket: WebSocket,
     master_fd: int,
     proc: asyncio.subprocess.Process,
 ) -> None:
     """Bridge WebSocket to a local PTY file descriptor."""
-    loop = asyncio.get_event_loop()
 
     async def read_output() -> None:
         while proc.returncode is None:
             try:
-                data = await loop.run_in_executor(None, lambda: os.read(master_fd, 4096))
+                data = _read_available(master_fd)
             except BlockingIOError:
-                await asyncio.sleep(0.01)
+                await _wait_readable(master_fd)
                 continue
             except OSError:
                 break
             if not data:
                 break
-            await websocket.send_text(data.decode("utf-8", errors="replace"))
+            # Raw bytes as a binary frame; the browser terminal decodes UTF-8
+            await websocket.send_bytes(data)
+
+    def handle_input(msg: str) -> None:
+        if size := _parse_resize(msg):
+            _resize_pty(master_fd, *size, proc)
+        else:
+            os.write(master_fd, msg.encode())
 
     read_task = asyncio.create_task(read_output())
 
     try:
-        while proc.returncode is None:
-            try:
-                msg = await asyncio.wait_for(websocket.receive_text(), timeout=0.1)
-            except TimeoutError:
-                continue
-            if size := _parse_resize(msg):
-                _resize_pty(master_fd, *size, proc)
-            else:
-                os.write(master_fd, msg.encode())
+        await _relay_input(websocket, proc.wait(), handle_input)
     finally:
         read_task.cancel()
+        # Let the reader unregister the fd before it is closed and maybe reused
+        await asyncio.gather(read_task, return_exceptions=True)
         os.close(master_fd)
         if proc.returncode is None:
             proc.terminate()
@@ -105,24 +178,22 @@ async def _bridge_websocket_to_ssh(
 
     async def read_stdout() -> None:
         while proc.returncode is None:
-            data = await proc.stdout.read(4096)
+            data = await proc.stdout.read(_PTY_READ_SIZE)
             if not data:
                 break
-            text = data if isinstance(data, str) else data.decode()
-            await websocket.send_text(text)
+            await websocket.send_bytes(data)
+
+    def handle_input(msg: str) -> None:
+        if size := _parse_resize(msg):
+            proc.change_terminal_size(*size)
+        else:
+            proc.stdin.write(msg.encode())
 
     read_task = asyncio.create_task(read_stdout())
 
     try:
-        while proc.returncode is None:
-            try:
-                msg = await asyncio.wait_for(websocket.receive_text(), timeout=0.1)
-            except TimeoutError:
-                continue
-            if size := _parse_resize(msg):
-                proc.change_terminal_size(*size)
-            else:
-                proc.stdin.write(msg)
+        # wait_closed rather than wait: wait() would also consume stdout
+        await _relay_input(websocket, proc.wait_closed(), handle_input)
     finally:
         read_task.cancel()
         proc.terminate()
@@ -162,15 +233,19 @@ async def _run_remote_exec(
     websocket: WebSocket, host: Host, exec_cmd: str, *, agent_forwarding: bool = False
 ) -> None:
     """Run docker exec on remote host via SSH with PTY."""
+    # Agent forwarding is per connection, so only those sessions get their own;
     # ssh_connect_kwargs includes agent_path and client_keys fallback
-    async with asyncssh.connect(
-        **ssh_connect_kwargs(host),
-        agent_forwarding=agent_forwarding,
-    ) as conn:
+    connection: contextlib.AbstractAsyncContextManager[asyncssh.SSHClientConnection] = (
+        asyncssh.connect(**ssh_connect_kwargs(host), agent_forwarding=True)
+        if agent_forwarding
+        else ssh_connection(host)
+    )
+    async with connection as conn:
         proc: asyncssh.SSHClientProcess[Any] = await conn.create_process(
             exec_cmd,
             term_type="xterm-256color",
             term_size=(80, 24),
+            encoding=None,  # Relay raw bytes; the browser terminal decodes them
         )
         async with proc:
             await _bridge_websocket_to_ssh(websocket, proc)
@@ -283,23 +358,44 @@ async def terminal_websocket(websocket: WebSocket, task_id: str) -> None:
         return
 
     task = tasks[task_id]
-    sent_count = 0
+    sent_seq = 0
+    # Each viewer has its own event: with a shared one, another viewer could
+    # clear a wakeup meant for this one while it is still sending
+    changed = asyncio.Event()
+    task["waiters"].add(changed)
 
     try:
         while True:
-            # Send any new output
-            while sent_count < len(task["output"]):
-                await websocket.send_text(task["output"][sent_count])
-                sent_count += 1
-
-            if task["status"] in ("completed", "failed"):
-                status = "[Done]" if task["status"] == "completed" else "[Failed]"
-                color = GREEN if task["status"] == "completed" else RED
-                await websocket.send_text(f"{CRLF}{color}{status}{RESET}{CRLF}")
+            # Cleared before draining so output appended while sending wakes us
+            changed.clear()
+
+            # Collect everything new into one frame, noting when some output
+            # fell out of the buffer before this client read it
+            output = task["output"]
+            seq = task["seq"]
+            first_seq = seq - len(output)
+            parts: list[str] = []
+            if sent_seq < first_seq:
+                parts.append(_TRUNCATED_NOTE)
+                sent_seq = first_seq
+            parts.extend(islice(output, sent_seq - first_seq, None))
+            sent_seq = seq
+
+            marker = _STATUS_MARKERS.get(task["status"])
+            done = marker is not None
+            if marker is not None:
+                parts.append(marker)
+
+            if parts:
+                await websocket.send_text("".join(parts))
+            if done:
                 await websocket.close()
                 break
 
-            await asyncio.sleep(0.05)
+            if task["seq"] == sent_seq and task["status"] == "running":
+                await changed.wait()
     except WebSocketDisconnect:
         pass
+    finally:
+        task["waiters"].discard(changed)
     # Task stays in memory for reconnection; cleanup_stale_tasks() handles expiry
@@ -1,5 +1,6 @@
 """Tests for Containers page routes."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -11,10 +12,16 @@ from compose_farm.glances import ContainerStats, format_bytes
 from compose_farm.registry import ImageRef, TagCheckResult
 from compose_farm.web.app import create_app
 from compose_farm.web.routes.containers import (
+    _check_update_html,
+    _container_stats_cache,
+    _get_registry_client,
     _infer_stack_service,
     _parse_image,
     _parse_uptime_seconds,
     _render_update_badge,
+    _update_check_cache,
+    close_registry_client,
+    get_containers_rows,
 )
 
 # Byte size constants for tests
@@ -23,12 +30,20 @@ MB = KB * 1024
 GB = MB * 1024
 
 
+@pytest.fixture(autouse=True)
+def _clear_container_stats_cache() -> None:
+    """Keep cached Glances results from leaking between tests."""
+    _container_stats_cache.clear()
+
+
 class TestFormatBytes:
-    """Tests for format_bytes function (uses humanize library)."""
+    """Tests for format_bytes function."""
 
     def test_bytes(self) -> None:
         assert format_bytes(500) == "500 Bytes"
         assert format_bytes(0) == "0 Bytes"
+        assert format_bytes(1) == "1 Byte"
+        assert format_bytes(KB - 1) == "1023 Bytes"
 
     def test_kilobytes(self) -> None:
         assert format_bytes(KB) == "1.0 KiB"
@@ -44,6 +59,11 @@ class TestFormatBytes:
         assert format_bytes(GB) == "1.0 GiB"
         assert format_bytes(GB * 2) == "2.0 GiB"
 
+    def test_larger_units(self) -> None:
+        assert format_bytes(GB * KB) == "1.0 TiB"
+        assert format_bytes(GB * KB * 3 // 2) == "1.5 TiB"
+        assert format_bytes(KB**9) == "1024.0 YiB"
+
 
 class TestParseImage:
     """Tests for _parse_image function."""
@@ -87,10 +107,25 @@ class TestParseUptimeSeconds:
         assert _parse_uptime_seconds("3 days") == 259200
         assert _parse_uptime_seconds("a day") == 86400
 
+    def test_compound(self) -> None:
+        assert _parse_uptime_seconds("2 days, 3 hours") == 2 * 86400 + 3 * 3600
+        assert _parse_uptime_seconds("1 week 2 Days") == 604800 + 2 * 86400
+
+    def test_article_as_one(self) -> None:
+        assert _parse_uptime_seconds("About an hour") == 3600
+        assert _parse_uptime_seconds("Less than a second") == 1
+
     def test_empty(self) -> None:
         assert _parse_uptime_seconds("") == 0
         assert _parse_uptime_seconds("-") == 0
 
+    def test_unspaced(self) -> None:
+        assert _parse_uptime_seconds("2days") == 172800
+        assert _parse_uptime_seconds("1week 3hours") == 604800 + 3 * 3600
+
+    def test_non_decimal_digits_ignored(self) -> None:
+        assert _parse_uptime_seconds("\u00b23 days") == 0
+
 
 class TestInferStackService:
     """Tests for _infer_stack_service function."""
@@ -157,6 +192,34 @@ class TestContainersPage:
         assert "Live Stats" in response.text
         assert "container-rows" in response.text
 
+    def test_containers_page_lists_hosts(self, client: TestClient, mock_config: Config) -> None:
+        """Test cached page output still follows the configured hosts."""
+        with patch("compose_farm.web.routes.containers.get_config") as mock:
+            mock.return_value = mock_config
+            first = client.get("/live-stats").text
+            mock_config.hosts["extra"] = Host(address="192.168.1.9")
+            second = client.get("/live-stats").text
+
+        assert "extra" not in first
+        assert "extra" in second
+
+    def test_containers_page_not_cached_under_auto_reload(
+        self, client: TestClient, mock_config: Config, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Edited templates show up immediately with `cf web --reload`."""
+        from compose_farm.web.deps import get_templates
+        from compose_farm.web.routes.containers import _render_containers_page
+
+        monkeypatch.setattr(get_templates().env, "auto_reload", True)
+        _render_containers_page.cache_clear()
+        with patch("compose_farm.web.routes.containers.get_config") as mock:
+            mock.return_value = mock_config
+            response = client.get("/live-stats")
+
+        assert response.status_code == 200
+        assert "Live Stats" in response.text
+        assert _render_containers_page.cache_info().currsize == 0
+
 
 class TestContainersRowsAPI:
     """Tests for containers rows HTML endpoint."""
@@ -270,6 +333,53 @@ class TestContainersRowsAPI:
             assert 'data-sort="3600"' in response.text  # uptime (1 hour = 3600s)
             assert 'data-sort="10' in response.text  # cpu
 
+    def test_rows_reuse_recent_glances_fetch(self, client: TestClient) -> None:
+        """Back-to-back polls share one Glances fetch."""
+        with (
+            patch("compose_farm.web.routes.containers.get_config") as mock_config,
+            patch(
+                "compose_farm.web.routes.containers.fetch_all_container_stats",
+                new_callable=AsyncMock,
+            ) as mock_fetch,
+        ):
+            mock_config.return_value = Config(
+                compose_dir=Path("/opt/compose"),
+                hosts={"nas": Host(address="192.168.1.6")},
+                stacks={"test": "nas"},
+                glances_stack="glances",
+            )
+            mock_fetch.return_value = []
+
+            client.get("/api/containers/rows")
+            client.get("/api/containers/rows")
+
+        assert mock_fetch.await_count == 1
+
+    async def test_concurrent_polls_share_one_glances_fetch(self) -> None:
+        """Polls arriving while a fetch is in flight wait for it instead of fetching again."""
+
+        async def slow_fetch(_config: Config) -> list[ContainerStats]:
+            await asyncio.sleep(0.01)
+            return []
+
+        with (
+            patch("compose_farm.web.routes.containers.get_config") as mock_config,
+            patch(
+                "compose_farm.web.routes.containers.fetch_all_container_stats",
+                new=AsyncMock(side_effect=slow_fetch),
+            ) as mock_fetch,
+        ):
+            mock_config.return_value = Config(
+                compose_dir=Path("/opt/compose"),
+                hosts={"nas": Host(address="192.168.1.6")},
+                stacks={"test": "nas"},
+                glances_stack="glances",
+            )
+
+            await asyncio.gather(get_containers_rows(), get_containers_rows())
+
+        assert mock_fetch.await_count == 1
+
 
 class TestUpdateBadge:
     """Tests for container update badge rendering."""
@@ -286,3 +396,53 @@ class TestUpdateBadge:
         assert "2 new" in html
         assert "tooltip whitespace-nowrap" in html
         assert "badge badge-warning badge-xs cursor-help whitespace-nowrap" in html
+
+    def test_registry_tags_are_escaped(self) -> None:
+        html = _render_update_badge(
+            TagCheckResult(
+                image=ImageRef.parse("nginx:1.0.0"),
+                current_digest="",
+                available_updates=['1.0.1"><script>'],
+            )
+        )
+
+        assert "<script>" not in html
+        assert "&quot;&gt;&lt;script&gt;" in html
+
+
+class TestRegistryClient:
+    """Tests for the shared registry HTTP client."""
+
+    async def test_client_is_reused_until_closed(self) -> None:
+        client = _get_registry_client()
+        assert _get_registry_client() is client
+
+        await close_registry_client()
+        assert client.is_closed
+
+        new_client = _get_registry_client()
+        assert new_client is not client
+        await close_registry_client()
+
+
+class TestCheckUpdateHtml:
+    """Tests for coalescing concurrent registry update checks."""
+
+    async def test_concurrent_checks_share_one_lookup(self) -> None:
+        _update_check_cache.clear()
+
+        async def slow_check(image: str, _client: object) -> TagCheckResult:
+            await asyncio.sleep(0.01)
+            return TagCheckResult(image=ImageRef.parse(image), current_digest="")
+
+        with patch(
+            "compose_farm.web.routes.containers.check_image_updates",
+            new=AsyncMock(side_effect=slow_check),
+        ) as mock_check:
+            results = await asyncio.gather(
+                *(_check_update_html("nginx:1.25", AsyncMock()) for _ in range(5))
+            )
+
+        assert mock_check.await_count == 1
+        assert len(set(results)) == 1
+        _update_check_cache.clear()
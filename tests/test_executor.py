@@ -1,9 +1,9 @@
 """Tests for executor module."""
 
+import asyncio
 import sys
-from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -12,6 +12,7 @@ from compose_farm.config import Config, Host
 from compose_farm.executor import (
     CommandResult,
     RemoteCheckError,
+    _compose_labels_cache,
     _run_local_command,
     _run_ssh_command,
     _stream_output_lines,
@@ -19,6 +20,8 @@ from compose_farm.executor import (
     check_networks_exist,
     check_paths_exist,
     check_stack_running,
+    close_ssh_connections,
+    get_container_compose_labels,
     get_running_stacks_on_host,
     is_local,
     run_command,
@@ -31,9 +34,14 @@ from compose_farm.executor import (
 linux_only = pytest.mark.skipif(sys.platform != "linux", reason="Linux-only shell commands")
 
 
-async def _async_lines(lines: list[str | bytes]) -> AsyncIterator[str | bytes]:
-    for line in lines:
-        yield line
+class _ChunkReader:
+    """Reader returning one queued chunk per read, like a pipe or SSH channel."""
+
+    def __init__(self, chunks: list[str | bytes]) -> None:
+        self.chunks = list(chunks)
+
+    async def read(self, n: int = -1) -> str | bytes:
+        return self.chunks.pop(0) if self.chunks else ""
 
 
 class _RecordingConsole:
@@ -64,12 +72,29 @@ class TestStreamOutputLines:
         output = _RecordingConsole()
         monkeypatch.setattr(executor, "console", output)
 
-        await _stream_output_lines(_async_lines(["Downloading [ok]\n"]), "wakapi")
+        await _stream_output_lines(_ChunkReader(["Downloading [ok]\n"]), "wakapi")
 
         assert output.calls == [
             ((f"{format_stack_prefix('wakapi')} Downloading \\[ok]\n",), {"end": ""})
         ]
 
+    async def test_stream_output_lines_prints_complete_lines_per_chunk(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from compose_farm import executor
+
+        output = _RecordingConsole()
+        monkeypatch.setattr(executor, "console", output)
+        chunks: list[str | bytes] = [b"one\ntwo\n\nth", b"r\xc3", b"\xa9e\nlast"]
+
+        await _stream_output_lines(_ChunkReader(chunks), "")
+
+        assert output.calls == [
+            (("one\ntwo\n",), {"end": ""}),
+            (("thr\u00e9e\n",), {"end": ""}),
+            (("last",), {"end": ""}),
+        ]
+
 
 class TestIsLocal:
     """Tests for is_local function."""
@@ -153,6 +178,131 @@ class TestRunCommand:
         assert output.calls == []
 
 
+class _FakeReader:
+    def __init__(self, data: str) -> None:
+        self._data = data
+
+    async def read(self) -> str:
+        return self._data
+
+
+class _FakeProcess:
+    exit_status = 0
+
+    def __init__(self, command: str) -> None:
+        self.stdout = _FakeReader(f"ran {command}")
+        self.stderr = _FakeReader("")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def wait(self) -> None:
+        pass
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def create_process(self, command: str) -> _FakeProcess:
+        return _FakeProcess(command)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        pass
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.close()
+
+
+class TestSshConnectionPool:
+    """Tests for reusing SSH connections across commands."""
+
+    async def test_commands_share_one_connection(self) -> None:
+        conns: list[_FakeConnection] = []
+
+        async def fake_connect(**kwargs: Any) -> _FakeConnection:
+            conns.append(_FakeConnection())
+            return conns[-1]
+
+        host = Host(address="192.168.1.10")
+        with patch("asyncssh.connect", side_effect=fake_connect):
+            first, second = await asyncio.gather(
+                _run_ssh_command(host, "one", "svc", stream=False),
+                _run_ssh_command(host, "two", "svc", stream=False),
+            )
+            assert len(conns) == 1
+            assert (first.stdout, second.stdout) == ("ran one", "ran two")
+
+            await close_ssh_connections()
+            assert conns[0].closed
+
+            await _run_ssh_command(host, "three", "svc", stream=False)
+            assert len(conns) == 2
+            await close_ssh_connections()
+
+    async def test_closed_connection_is_replaced(self) -> None:
+        conns: list[_FakeConnection] = []
+
+        async def fake_connect(**kwargs: Any) -> _FakeConnection:
+            conns.append(_FakeConnection())
+            return conns[-1]
+
+        host = Host(address="192.168.1.10")
+        with patch("asyncssh.connect", side_effect=fake_connect):
+            await _run_ssh_command(host, "one", "svc", stream=False)
+            conns[0].closed = True  # e.g. the remote host restarted
+            result = await _run_ssh_command(host, "two", "svc", stream=False)
+            await close_ssh_connections()
+
+        assert len(conns) == 2
+        assert result.success is True
+
+    async def test_extra_connections_limit_concurrent_handshakes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from compose_farm import executor
+
+        monkeypatch.setattr(executor, "_SSH_MAX_SHARED_CHANNELS", 1)
+        monkeypatch.setattr(executor, "_SSH_MAX_HANDSHAKES", 2)
+        conns: list[_FakeConnection] = []
+        connecting = peak = 0
+
+        async def fake_connect(**kwargs: Any) -> _FakeConnection:
+            nonlocal connecting, peak
+            connecting += 1
+            peak = max(peak, connecting)
+            await asyncio.sleep(0.01)
+            connecting -= 1
+            conns.append(_FakeConnection())
+            return conns[-1]
+
+        host = Host(address="192.168.1.10")
+
+        async def hold_connection() -> None:
+            async with executor.ssh_connection(host):
+                await asyncio.sleep(0.05)
+
+        with patch("asyncssh.connect", side_effect=fake_connect):
+            await asyncio.gather(*(hold_connection() for _ in range(6)))
+            await close_ssh_connections()
+
+        assert len(conns) == 6
+        assert peak == 2
+        assert all(conn.closed for conn in conns)
+
+
 class TestBuildSshCommand:
     """Tests for native SSH command construction."""
 
@@ -413,6 +563,32 @@ class TestRunOnStacks:
         mock_run.assert_awaited_once()
         assert mock_run.call_args.kwargs["raw"] is True
 
+    async def test_run_on_stacks_runs_multi_and_single_host_stacks_together(self) -> None:
+        """Single-host stacks do not wait for multi-host stacks to finish."""
+        config = Config(
+            compose_dir=Path("/tmp"),
+            hosts={
+                "host1": Host(address="192.168.1.1"),
+                "host2": Host(address="192.168.1.2"),
+            },
+            stacks={"glances": ["host1", "host2"], "app": "host1"},
+        )
+        running = peak = 0
+
+        async def slow_run(_host: Host, _command: str, stack: str, **kwargs: Any) -> CommandResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return CommandResult(stack=stack, exit_code=0, success=True, label=kwargs["label"])
+
+        with patch("compose_farm.executor.run_command", new=AsyncMock(side_effect=slow_run)):
+            results = await run_on_stacks(config, ["glances", "app"], "pull", stream=False)
+
+        assert peak == 3
+        assert [r.label for r in results] == ["glances@host1", "glances@host2", "app"]
+
 
 @linux_only
 class TestCheckPathsExist:
@@ -606,3 +782,54 @@ class TestGetRunningStacksOnHost:
         # Result should not contain empty strings
         result = await get_running_stacks_on_host(config, "local")
         assert "" not in result
+
+
+class TestGetContainerComposeLabels:
+    """Tests for get_container_compose_labels function."""
+
+    async def test_concurrent_calls_share_one_docker_ps(self, tmp_path: Path) -> None:
+        """Concurrent requests for the same host run docker ps only once."""
+        _compose_labels_cache.clear()
+        config = Config(
+            compose_dir=tmp_path,
+            hosts={"nas": Host(address="192.168.1.6")},
+            stacks={},
+        )
+
+        async def slow_run(*_args: Any, **_kwargs: Any) -> CommandResult:
+            await asyncio.sleep(0.01)
+            return CommandResult(stack="nas", exit_code=0, success=True, stdout="web\tapp\tnginx\n")
+
+        with patch(
+            "compose_farm.executor.run_command", new=AsyncMock(side_effect=slow_run)
+        ) as mock:
+            results = await asyncio.gather(
+                *(get_container_compose_labels(config, "nas") for _ in range(3))
+            )
+
+        assert mock.await_count == 1
+        assert all(r == {"web": ("app", "nginx")} for r in results)
+        _compose_labels_cache.clear()
+
+    async def test_concurrent_calls_share_one_failed_docker_ps(self, tmp_path: Path) -> None:
+        """Callers waiting on a failing host get the same failure, not a retry each."""
+        _compose_labels_cache.clear()
+        config = Config(
+            compose_dir=tmp_path,
+            hosts={"nas": Host(address="192.168.1.6")},
+            stacks={},
+        )
+
+        async def failing_run(*_args: Any, **_kwargs: Any) -> CommandResult:
+            await asyncio.sleep(0.01)
+            raise OSError
+
+        with patch(
+            "compose_farm.executor.run_command", new=AsyncMock(side_effect=failing_run)
+        ) as mock:
+            results = await asyncio.gather(
+                *(get_container_compose_labels(config, "nas") for _ in range(3))
+            )
+
+        assert mock.await_count == 1
+        assert results == [{}, {}, {}]
@@ -1,15 +1,21 @@
 """Tests for state module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from compose_farm.config import Config, Host
 from compose_farm.state import (
     add_stack_host,
+    compute_dashboard,
+    dump_deployed,
     get_orphaned_stacks,
     get_stack_host,
+    get_stacks_needing_migration,
     get_stacks_not_in_state,
+    group_running_stacks_by_host,
     load_state,
     remove_stack,
     save_state,
@@ -46,6 +52,29 @@ class TestLoadState:
         result = load_state(config)
         assert result == {"plex": "nas01", "jellyfin": "nas02"}
 
+    def test_load_state_reuses_parse_until_file_changes(self, config: Config) -> None:
+        """Repeated loads of an unchanged file don't re-parse it."""
+        state_file = config.get_state_path()
+        state_file.write_text("deployed:\n  plex: nas01\n")
+
+        with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+            load_state(config)
+            load_state(config)
+            assert mock_load.call_count == 1
+
+            state_file.write_text("deployed:\n  plex: nas01\n  jellyfin: nas02\n")
+            assert load_state(config) == {"plex": "nas01", "jellyfin": "nas02"}
+            assert mock_load.call_count == 2
+
+    def test_load_state_returns_independent_copy(self, config: Config) -> None:
+        """Modifying the returned dict doesn't affect later loads."""
+        state_file = config.get_state_path()
+        state_file.write_text("deployed:\n  plex: nas01\n")
+
+        load_state(config)["jellyfin"] = "nas02"
+
+        assert load_state(config) == {"plex": "nas01"}
+
     def test_load_state_empty_file(self, config: Config) -> None:
         """Returns empty dict for empty file."""
         state_file = config.get_state_path()
@@ -55,6 +84,24 @@ class TestLoadState:
         assert result == {}
 
 
+class TestDumpDeployed:
+    """Tests for dump_deployed function."""
+
+    @pytest.mark.parametrize(
+        "deployed",
+        [
+            {},
+            {"plex": "nas01", "jellyfin": "nas02"},
+            {"glances": ["nas01", "nuc"], "my-app.v2": "nas01"},
+            {"empty": []},
+            {"2fauth": "nas01", "weird": "yes", "quoted": "a: b"},
+        ],
+    )
+    def test_matches_yaml_dump(self, deployed: dict[str, str | list[str]]) -> None:
+        expected = yaml.dump({"deployed": deployed}, default_flow_style=False, sort_keys=False)
+        assert dump_deployed(deployed) == expected
+
+
 class TestSaveState:
     """Tests for save_state function."""
 
@@ -354,3 +401,32 @@ class TestGetStacksNotInState:
 
         result = get_stacks_not_in_state(cfg)
         assert result == []
+
+
+class TestComputeDashboard:
+    """Tests for compute_dashboard function."""
+
+    def test_matches_individual_helpers(self, tmp_path: Path) -> None:
+        """The single-pass snapshot agrees with the per-purpose helpers."""
+        config_path = tmp_path / "compose-farm.yaml"
+        config_path.write_text("")
+        cfg = Config(
+            compose_dir=tmp_path / "compose",
+            hosts={"nas01": Host(address="192.168.1.10"), "nas02": Host(address="192.168.1.11")},
+            stacks={"plex": "nas01", "jellyfin": "nas01", "glances": "all", "new": "nas02"},
+            config_path=config_path,
+        )
+        cfg.get_state_path().write_text(
+            "deployed:\n  plex: nas01\n  jellyfin: nas02\n"
+            "  glances:\n  - nas01\n  - nas02\n  old: nas01\n"
+        )
+
+        snapshot = compute_dashboard(cfg)
+
+        assert snapshot.deployed == load_state(cfg)
+        assert snapshot.running_count == 3
+        assert snapshot.stopped_count == 1
+        assert snapshot.orphaned == get_orphaned_stacks(cfg) == {"old": "nas01"}
+        assert snapshot.migrations == get_stacks_needing_migration(cfg) == ["jellyfin"]
+        assert snapshot.not_started == get_stacks_not_in_state(cfg) == ["new"]
+        assert snapshot.stacks_by_host == group_running_stacks_by_host(snapshot.deployed, cfg.hosts)
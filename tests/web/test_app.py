@@ -0,0 +1,109 @@
+"""Tests for application-level middleware."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from compose_farm.web.app import _etag_middleware, create_app
+from compose_farm.web.deps import get_templates, precompile_templates
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from compose_farm.config import Config
+
+
+@pytest.fixture
+def client(mock_config: Config, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    from compose_farm.web.routes import pages
+
+    monkeypatch.setattr(pages, "get_config", lambda: mock_config)
+    return TestClient(create_app())
+
+
+class TestETagMiddleware:
+    """Tests for ETag revalidation of HTML responses."""
+
+    def test_html_response_has_etag(self, client: TestClient) -> None:
+        response = client.get("/partials/stats")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_matching_etag_returns_304(self, client: TestClient) -> None:
+        etag = client.get("/partials/stats").headers["etag"]
+
+        response = client.get("/partials/stats", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_full_body(self, client: TestClient) -> None:
+        response = client.get("/partials/stats", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.content
+
+    def test_json_response_has_no_etag(self, client: TestClient) -> None:
+        response = client.post("/api/containers/check-updates", json={"items": []})
+
+        assert "etag" not in response.headers
+
+    def test_streaming_html_returns_304(self, middleware_client: TestClient) -> None:
+        etag = middleware_client.get("/stream").headers["etag"]
+
+        response = middleware_client.get("/stream", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_repeated_headers_are_kept(self, middleware_client: TestClient) -> None:
+        response = middleware_client.get("/cookies")
+
+        assert response.headers["etag"]
+        cookies = [c.split(";")[0] for c in response.headers.get_list("set-cookie")]
+        assert cookies == ["a=1", "b=2"]
+
+
+@pytest.fixture
+def middleware_client() -> TestClient:
+    app = FastAPI()
+    app.middleware("http")(_etag_middleware)
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"<p>one</p>"
+            yield b"<p>two</p>"
+
+        return StreamingResponse(chunks(), media_type="text/html")
+
+    @app.get("/cookies")
+    async def cookies() -> HTMLResponse:
+        response = HTMLResponse("<p>hi</p>")
+        response.set_cookie("a", "1")
+        response.set_cookie("b", "2")
+        return response
+
+    return TestClient(app)
+
+
+class TestTemplates:
+    """Tests for the shared Jinja environment."""
+
+    def test_precompile_caches_all_templates(self) -> None:
+        precompile_templates()
+
+        env = get_templates().env
+        cached = {template.name for template in env.cache.values()}  # type: ignore[union-attr]
+        assert set(env.list_templates(extensions=["html"])) <= cached
+
+    def test_auto_reload_disabled_by_default(self) -> None:
+        assert get_templates().env.auto_reload is False
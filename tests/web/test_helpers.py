@@ -246,3 +246,98 @@ class TestRenderContainers:
 
         assert "app-web-1" in html
         assert "app-db-1" in html
+
+
+class TestReadTextIfExists:
+    """Tests for the mtime-keyed file read helper used by stack pages."""
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        from compose_farm.web.routes.pages import _read_text_if_exists
+
+        assert _read_text_if_exists(tmp_path / "missing.env") == ""
+
+    def test_edit_invalidates_cached_content(self, tmp_path: Path) -> None:
+        from compose_farm.web.routes.pages import _read_text_if_exists
+
+        path = tmp_path / ".env"
+        path.write_text("A=1\n")
+        assert _read_text_if_exists(path) == "A=1\n"
+
+        path.write_text("A=12\n")
+        assert _read_text_if_exists(path) == "A=12\n"
+
+
+class TestRenderPartial:
+    """Tests for the rendered partial cache."""
+
+    def test_identical_context_reuses_html(self) -> None:
+        from unittest.mock import patch
+
+        from compose_farm.web.deps import get_templates
+        from compose_farm.web.routes import pages
+
+        pages._partial_cache.clear()
+        templates = get_templates()
+        context = {"running_count": 1, "stopped_count": 2, "hosts": {}, "stacks": {"a": "h"}}
+        with patch.object(templates, "get_template", wraps=templates.get_template) as mock:
+            first = pages._render_partial("partials/stats.html", context)
+            second = pages._render_partial("partials/stats.html", dict(context))
+            assert mock.call_count == 1
+
+            changed = pages._render_partial("partials/stats.html", {**context, "running_count": 3})
+            assert mock.call_count == 2
+
+        assert first.body == second.body
+        assert changed.body != first.body
+        pages._partial_cache.clear()
+
+    def test_auto_reload_skips_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from unittest.mock import patch
+
+        from compose_farm.web.deps import get_templates
+        from compose_farm.web.routes import pages
+
+        pages._partial_cache.clear()
+        templates = get_templates()
+        monkeypatch.setattr(templates.env, "auto_reload", True)
+        context = {"running_count": 1, "stopped_count": 2, "hosts": {}, "stacks": {}}
+        with patch.object(templates, "get_template", wraps=templates.get_template) as mock:
+            pages._render_partial("partials/stats.html", context)
+            pages._render_partial("partials/stats.html", context)
+
+        assert mock.call_count == 2
+        assert not pages._partial_cache
+
+
+class TestConfigErrorPartial:
+    """Tests for the config error banner partial."""
+
+    async def test_validation_cached_until_config_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import os
+        from unittest.mock import patch
+
+        from compose_farm.web.routes import pages
+
+        config_file = tmp_path / "compose-farm.yaml"
+        config_file.write_text("hosts: {}\n")
+        monkeypatch.setenv("CF_CONFIG", str(config_file))
+        pages._config_error_at.cache_clear()
+
+        with patch.object(pages, "get_config", side_effect=FileNotFoundError("gone")) as mock:
+            first = await pages.config_error_partial()
+            second = await pages.config_error_partial()
+            assert mock.call_count == 1
+            assert first.body == second.body
+            assert b"gone" in first.body
+
+            mock.side_effect = None
+            config_file.write_text("hosts: {a: {address: 1.2.3.4}}\n")
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            fixed = await pages.config_error_partial()
+            assert mock.call_count == 2
+            assert fixed.body == b""
+
+        pages._config_error_at.cache_clear()
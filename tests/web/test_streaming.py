@@ -0,0 +1,316 @@
+"""Tests for the task output buffer and terminal streaming."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Self, cast
+
+import pytest
+from fastapi.testclient import TestClient
+
+from compose_farm.web import streaming
+from compose_farm.web.app import create_app
+from compose_farm.web.streaming import (
+    CRLF,
+    TASK_TTL_SECONDS,
+    cleanup_stale_tasks,
+    finish_task,
+    new_task,
+    stream_to_task,
+    tasks,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def task_id() -> Iterator[str]:
+    tasks["test-task"] = new_task()
+    yield "test-task"
+    tasks.pop("test-task", None)
+
+
+class TestStreamToTask:
+    """Tests for appending output to a task."""
+
+    def test_appends_and_counts(self, task_id: str) -> None:
+        stream_to_task(task_id, "one\r\n")
+        stream_to_task(task_id, "two\r\n")
+
+        assert list(tasks[task_id]["output"]) == ["one\r\n", "two\r\n"]
+        assert tasks[task_id]["seq"] == 2
+
+    def test_wakes_readers(self, task_id: str) -> None:
+        changed = asyncio.Event()
+        tasks[task_id]["waiters"].add(changed)
+
+        stream_to_task(task_id, "line\r\n")
+        assert changed.is_set()
+
+        changed.clear()
+        finish_task(task_id, success=False)
+        assert changed.is_set()
+        assert tasks[task_id]["status"] == "failed"
+        assert tasks[task_id]["completed_at"] > 0
+
+    def test_unknown_task_is_ignored(self) -> None:
+        stream_to_task("missing", "ignored")
+
+        assert "missing" not in tasks
+
+    def test_output_is_bounded_by_size(self, task_id: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(streaming, "TASK_OUTPUT_MAX_CHARS", 7)
+
+        for chunk in ("ab", "cd", "ef", "gh", "ijklm"):
+            stream_to_task(task_id, chunk)
+
+        assert list(tasks[task_id]["output"]) == ["gh", "ijklm"]
+        assert tasks[task_id]["size"] == 7
+        assert tasks[task_id]["seq"] == 5
+
+    def test_oversized_chunk_is_kept(self, task_id: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(streaming, "TASK_OUTPUT_MAX_CHARS", 4)
+
+        stream_to_task(task_id, "ab")
+        stream_to_task(task_id, "cdefgh")
+
+        assert list(tasks[task_id]["output"]) == ["cdefgh"]
+
+
+class TestCleanupStaleTasks:
+    """Tests for expiring completed tasks."""
+
+    def test_removes_only_expired_tasks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(streaming, "_completed", [])
+        now = 10_000.0
+        for tid in ("old", "fresh", "running"):
+            tasks[tid] = new_task()
+        monkeypatch.setattr(
+            "compose_farm.web.streaming.time.time", lambda: now - TASK_TTL_SECONDS - 1
+        )
+        finish_task("old", success=True)
+        monkeypatch.setattr("compose_farm.web.streaming.time.time", lambda: now)
+        finish_task("fresh", success=True)
+
+        try:
+            assert cleanup_stale_tasks() == 1
+            assert "old" not in tasks
+            assert {"fresh", "running"} <= tasks.keys()
+            assert cleanup_stale_tasks() == 0
+        finally:
+            for tid in ("old", "fresh", "running"):
+                tasks.pop(tid, None)
+
+
+class TestStreamSubprocess:
+    """Tests for forwarding subprocess output to a task."""
+
+    async def test_output_converted_to_crlf(self, task_id: str) -> None:
+        script = "import sys; sys.stdout.write('caf\\u00e9\\nline two\\r\\nend')"
+
+        exit_code = await streaming._stream_subprocess(
+            task_id, [sys.executable, "-c", script], {"PYTHONIOENCODING": "utf-8"}
+        )
+
+        assert exit_code == 0
+        assert "".join(tasks[task_id]["output"]) == "caf\u00e9\r\nline two\r\nend"
+
+
+class TestSubprocessEnv:
+    """Tests for the cached cf subprocess environment."""
+
+    def test_env_reused_per_socket(self) -> None:
+        streaming._subprocess_env.cache_clear()
+
+        env = streaming._subprocess_env("/tmp/agent.sock", terminal=True)
+
+        assert env["SSH_AUTH_SOCK"] == "/tmp/agent.sock"
+        assert env["TERM"] == "xterm-256color"
+        assert streaming._subprocess_env("/tmp/agent.sock", terminal=True) is env
+        assert streaming._subprocess_env("/tmp/other.sock", terminal=True) is not env
+        streaming._subprocess_env.cache_clear()
+
+    def test_ssh_sock_lookup_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[int] = []
+
+        def fake_lookup() -> str:
+            calls.append(1)
+            return f"/tmp/agent-{len(calls)}.sock"
+
+        monkeypatch.setattr(streaming, "get_ssh_auth_sock", fake_lookup)
+        monkeypatch.setattr(streaming, "_ssh_sock_cache", None)
+
+        assert streaming._ssh_auth_sock() == "/tmp/agent-1.sock"
+        assert streaming._ssh_auth_sock() == "/tmp/agent-1.sock"
+        assert len(calls) == 1
+
+        monkeypatch.setattr(streaming, "_SSH_SOCK_TTL_SECONDS", 0.0)
+        assert streaming._ssh_auth_sock() == "/tmp/agent-2.sock"
+
+
+class TestTerminalWebsocket:
+    """Tests for replaying task output over the terminal websocket."""
+
+    def test_reports_truncated_output(self, task_id: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(streaming, "TASK_OUTPUT_MAX_CHARS", 2)
+        for line in ("a", "b", "c", "d"):
+            stream_to_task(task_id, line)
+        finish_task(task_id, success=True)
+
+        client = TestClient(create_app())
+        with client.websocket_connect(f"/ws/terminal/{task_id}") as ws:
+            frame = ws.receive_text()
+
+        truncated, rest = frame.split(CRLF, 1)
+        assert "earlier output truncated" in truncated
+        assert rest.startswith("cd")
+        assert "[Done]" in rest
+
+    async def test_concurrent_viewers_both_see_completion(self, task_id: str) -> None:
+        from compose_farm.web import ws
+
+        fast = _ViewerWebSocket(send_delay=0)
+        slow = _ViewerWebSocket(send_delay=0.02)
+        viewers = [
+            asyncio.create_task(ws.terminal_websocket(cast("Any", fast), task_id)),
+            asyncio.create_task(ws.terminal_websocket(cast("Any", slow), task_id)),
+        ]
+        await asyncio.sleep(0.01)
+
+        stream_to_task(task_id, "a")
+        # Finish while the slow viewer is still sending "a"
+        await asyncio.sleep(0.01)
+        finish_task(task_id, success=True)
+
+        await asyncio.wait_for(asyncio.gather(*viewers), timeout=2)
+        for viewer in (fast, slow):
+            assert viewer.closed
+            assert "".join(viewer.sent).startswith("a")
+            assert "[Done]" in viewer.sent[-1]
+        assert not tasks[task_id]["waiters"]
+
+
+class _ViewerWebSocket:
+    def __init__(self, send_delay: float) -> None:
+        self.send_delay = send_delay
+        self.sent: list[str] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(self.send_delay)
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+class _CollectingWebSocket:
+    def __init__(self, incoming: list[str] | None = None) -> None:
+        self.sent: list[bytes] = []
+        self.incoming = incoming or []
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    async def receive_text(self) -> str:
+        if self.incoming:
+            return self.incoming.pop(0)
+        await asyncio.sleep(10)
+        return ""
+
+
+class TestLocalExecBridge:
+    """Tests for relaying a local PTY to the websocket."""
+
+    def test_read_available_drains_buffered_writes(self) -> None:
+        from compose_farm.web import ws
+
+        read_fd, write_fd = os.pipe()
+        try:
+            os.set_blocking(read_fd, False)
+            with pytest.raises(BlockingIOError):
+                ws._read_available(read_fd)
+
+            os.write(write_fd, "caf\u00e9 ".encode())
+            os.write(write_fd, b"more")
+            assert ws._read_available(read_fd) == "caf\u00e9 more".encode()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Linux PTY semantics")
+    async def test_relays_pty_output_until_exit(self) -> None:
+        from compose_farm.web import ws
+
+        websocket = _CollectingWebSocket()
+        script = "for i in 1 2 3; do echo line$i; sleep 0.05; done"
+
+        await ws._run_local_exec(cast("Any", websocket), ["sh", "-c", script])
+
+        assert b"".join(websocket.sent) == b"line1\r\nline2\r\nline3\r\n"
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Linux PTY semantics")
+    async def test_forwards_input_and_stops_on_exit(self) -> None:
+        from compose_farm.web import ws
+
+        websocket = _CollectingWebSocket(incoming=["hello\n"])
+
+        await asyncio.wait_for(
+            ws._run_local_exec(
+                cast("Any", websocket), ["sh", "-c", "read line; echo got:$line; sleep 0.05"]
+            ),
+            timeout=5,
+        )
+
+        assert b"got:hello" in b"".join(websocket.sent)
+
+
+class TestRemoteExec:
+    """Tests for opening remote exec sessions."""
+
+    async def test_exec_reuses_pooled_connection(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from contextlib import asynccontextmanager
+
+        from compose_farm.config import Host
+        from compose_farm.web import ws
+
+        commands: list[str] = []
+
+        class FakeProcess:
+            async def __aenter__(self) -> Self:
+                return self
+
+            async def __aexit__(self, *args: object) -> None:
+                pass
+
+        class FakeConnection:
+            async def create_process(self, command: str, **kwargs: object) -> FakeProcess:
+                commands.append(command)
+                return FakeProcess()
+
+        @asynccontextmanager
+        async def fake_ssh_connection(host: Host) -> Any:
+            yield FakeConnection()
+
+        async def fake_bridge(websocket: object, proc: object) -> None:
+            pass
+
+        def fail_connect(**kwargs: object) -> None:
+            msg = "exec should not open its own connection"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(ws, "ssh_connection", fake_ssh_connection)
+        monkeypatch.setattr(ws, "_bridge_websocket_to_ssh", fake_bridge)
+        monkeypatch.setattr("asyncssh.connect", fail_connect)
+
+        await ws._run_remote_exec(
+            cast("Any", _CollectingWebSocket()), Host(address="10.0.0.1"), "docker exec -it c sh"
+        )
+
+        assert commands == ["docker exec -it c sh"]